@@ -1,11 +1,15 @@
-from typing import List, Dict
+from types import MappingProxyType
+from typing import List, Dict, Tuple
 
+import py.constants
 import py.cube_coord
 import py.cell
+import py.zobrist
 
 
 class Board:
     def __init__(self, map: Dict[py.cube_coord.CubeCoord, py.cell.Cell]):
+        self._frozen: bool = False  # see freeze
 
         self.map: Dict[py.cube_coord.CubeCoord, py.cell.Cell] = map
 
@@ -16,3 +20,193 @@ class Board:
                 key=lambda item: item[1].getIndex(),
             )
         ]
+
+        self.cells: List[py.cell.Cell] = [self.map[coord] for coord in self.coords]
+
+        indexes: Dict[Tuple[int, int, int], int] = {
+            (coord.getX(), coord.getY(), coord.getZ()): cell.getIndex()
+            for (coord, cell) in self.map.items()
+        }
+
+        # flat table of the 6 neighbour indices of each cell (-1 when off-board)
+        self.neighbours: List[int] = self._buildNeighbours(indexes)
+
+        # flat table of the cells reached by a shadow ray, keyed by
+        # (cell, sun orientation, distance 1-3) (-1 when off-board)
+        self.rays: List[int] = self._buildRays()
+
+        # in-board cells within distance 1-3 of each cell, keyed by
+        # (cell, radius), in the order the seeding moves are listed
+        self.seedRanges: List[Tuple[int, ...]] = self._buildSeedRanges(indexes)
+
+        # flat table of the cells that shade a cell from distance 1-3, keyed by
+        # (cell, sun orientation, distance) (-1 when off-board) : the rays above
+        # looking the other way
+        self.shadowSources: List[int] = self._buildShadowSources()
+
+        # bitmask versions of the tables above, for bitboard states :
+        # cells shaded by a tree keyed by (cell, sun orientation, size 0-3)
+        # and cells in seeding range keyed by (cell, radius)
+        self.shadowMasks: List[int] = self._buildShadowMasks()
+        self.seedRangeMasks: List[int] = [
+            sum(1 << target for target in targets) for targets in self.seedRanges
+        ]
+
+        # distance between every pair of cells, keyed by (cell, cell)
+        self.distances: bytes = self._buildDistances()
+
+        # Zobrist keys of the trees, shared by the games played on the board
+        self.zobrist: py.zobrist.Zobrist = py.zobrist.Zobrist(self)
+
+    def _buildNeighbours(self, indexes: Dict[Tuple[int, int, int], int]) -> List[int]:
+        directions = py.cube_coord.CubeCoord.directions
+        neighbours: List[int] = [-1] * (len(self.coords) * len(directions))
+        for coord in self.coords:
+            index: int = self.map[coord].getIndex()
+            for orientation, (dx, dy, dz) in enumerate(directions):
+                neighbours[index * len(directions) + orientation] = indexes.get(
+                    (coord.getX() + dx, coord.getY() + dy, coord.getZ() + dz), -1
+                )
+        return neighbours
+
+    def _buildRays(self) -> List[int]:
+        length: int = py.constants.Constants.TREE_TALL
+        rays: List[int] = [-1] * (len(self.coords) * 6 * length)
+        for index in range(len(self.coords)):
+            for orientation in range(6):
+                target: int = index
+                for distance in range(length):
+                    target = self.neighbours[target * 6 + orientation]
+                    if target < 0:
+                        break
+                    rays[(index * 6 + orientation) * length + distance] = target
+        return rays
+
+    def _buildShadowSources(self) -> List[int]:
+        length: int = py.constants.Constants.TREE_TALL
+        shadowSources: List[int] = [-1] * (len(self.coords) * 6 * length)
+        for index in range(len(self.coords)):
+            for orientation in range(6):
+                ray: int = (index * 6 + (orientation + 3) % 6) * length
+                key: int = (index * 6 + orientation) * length
+                shadowSources[key : key + length] = self.rays[ray : ray + length]
+        return shadowSources
+
+    def _buildSeedRanges(
+        self, indexes: Dict[Tuple[int, int, int], int]
+    ) -> List[Tuple[int, ...]]:
+        length: int = py.constants.Constants.TREE_TALL + 1
+        seedRanges: List[Tuple[int, ...]] = [()] * (len(self.coords) * length)
+        for coord in self.coords:
+            index: int = self.map[coord].getIndex()
+            for N in range(1, length):
+                targets: List[int] = list()
+                for x in range(-N, N + 1):
+                    for y in range(max(-N, -x - N), min(+N, -x + N) + 1):
+                        target: int = indexes.get(
+                            (coord.getX() + x, coord.getY() + y, coord.getZ() - x - y),
+                            -1,
+                        )
+                        if target >= 0 and target != index:
+                            targets.append(target)
+                seedRanges[index * length + N] = tuple(targets)
+        return seedRanges
+
+    def _buildShadowMasks(self) -> List[int]:
+        shadowMasks: List[int] = [0] * (len(self.coords) * 6 * 4)
+        for index in range(len(self.coords)):
+            for orientation in range(6):
+                mask: int = 0
+                for size in range(1, 4):
+                    target: int = self.getRayIndex(index, orientation, size)
+                    if target >= 0:
+                        mask |= 1 << target
+                    shadowMasks[(index * 6 + orientation) * 4 + size] = mask
+        return shadowMasks
+
+    def _buildDistances(self) -> bytes:
+        return bytes(
+            (
+                abs(a.getX() - b.getX())
+                + abs(a.getY() - b.getY())
+                + abs(a.getZ() - b.getZ())
+            )
+            // 2
+            for a in self.coords
+            for b in self.coords
+        )
+
+    def freeze(self):
+        """
+        Makes the board read-only, for boards shared between games : the
+        tables become tuples, the map a read-only view and the cells frozen.
+        """
+        for cell in self.cells:
+            cell.freeze()
+        for name in (
+            "coords",
+            "cells",
+            "neighbours",
+            "rays",
+            "seedRanges",
+            "shadowSources",
+            "shadowMasks",
+            "seedRangeMasks",
+        ):
+            setattr(self, name, tuple(getattr(self, name)))
+        self.map = MappingProxyType(self.map)
+        self._frozen = True
+
+    def __setattr__(self, name: str, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError("Board is read-only once frozen")
+        super().__setattr__(name, value)
+
+    def __reduce_ex__(self, protocol: int):
+        # the read-only map view cannot be pickled : rebuild frozen boards
+        if getattr(self, "_frozen", False):
+            return (_frozenBoard, (dict(self.map),))
+        return super().__reduce_ex__(protocol)
+
+    def getNeighbourIndex(self, index: int, orientation: int) -> int:
+        return self.neighbours[index * 6 + orientation]
+
+    def getRayIndex(self, index: int, orientation: int, distance: int) -> int:
+        return self.rays[(index * 6 + orientation) * 3 + distance - 1]
+
+    def getShadowSourceIndex(self, index: int, orientation: int, distance: int) -> int:
+        return self.shadowSources[(index * 6 + orientation) * 3 + distance - 1]
+
+    def getShadowLevels(self, sizes: List[int]) -> List[List[int]]:
+        """
+        Shadow levels of every cell for the 6 sun orientations, levels[o][cell],
+        given the tree size on each cell (-1 when empty).
+        """
+        cellCount: int = len(self.coords)
+        levels: List[List[int]] = [[0] * cellCount for _ in range(6)]
+        shadowSources: List[int] = self.shadowSources
+        for index in range(cellCount):
+            key: int = index * 18
+            for orientation in range(6):
+                level: int = 0
+                for distance in range(1, 4):
+                    source: int = shadowSources[key]
+                    key += 1
+                    if source >= 0:
+                        size: int = sizes[source]
+                        if size >= distance and size > level:
+                            level = size
+                levels[orientation][index] = level
+        return levels
+
+    def getCellsInRange(self, index: int, radius: int) -> Tuple[int, ...]:
+        return self.seedRanges[index * 4 + radius]
+
+    def getDistance(self, index: int, other: int) -> int:
+        return self.distances[index * len(self.coords) + other]
+
+
+def _frozenBoard(map: Dict[py.cube_coord.CubeCoord, py.cell.Cell]) -> Board:
+    board: Board = Board(map)
+    board.freeze()
+    return board
@@ -1,11 +1,14 @@
 class Cell:
 
+    __slots__ = ("_valid", "_richness", "_index", "_frozen")
+
     NO_CELL = None
 
     def __init__(self, index: int, valid: bool = True):
         self._valid = valid
         self._richness: int = None
         self._index: int = index
+        self._frozen: bool = False
 
     def getIndex(self) -> int:
         return self._index if self._valid else -1
@@ -14,8 +17,13 @@ class Cell:
         return self._valid
 
     def setRichness(self, richness: int):
+        if self._frozen:
+            raise AttributeError("Cell is read-only once its board is frozen")
         self._richness = richness
 
+    def freeze(self):
+        self._frozen = True
+
     def getRichness(self) -> int:
         return self._richness
 
@@ -1,6 +1,7 @@
 import sys
-from typing import List, Dict
+from typing import Callable, Container, Dict, Iterator, List, Tuple
 
+from py.exception.ActionNotEnabledException import ActionNotEnabledException
 from py.exception.AlreadyActivatedTree import AlreadyActivatedTree
 from py.exception.CellNotEmptyException import CellNotEmptyException
 from py.exception.CellNotFoundException import CellNotFoundException
@@ -15,6 +16,7 @@ from py.exception.TreeNotTallException import TreeNotTallException
 from py.exception.TreeTooFarException import TreeTooFarException
 
 from py.action.Action import Action
+from py.action_error import ActionError
 
 from py.codingame import MultiplayerGameManager
 
@@ -26,12 +28,16 @@ import py.constants
 import py.config
 import py.cube_coord
 import py.seed
+import py.shadow_map
 import py.sun
+import py.sun_forecast
 import py.tree
+import py.zobrist
 import py.cell
 import py.frame_type
 import py.player
 import py.game_summary_manager
+from py.move_type import Move, MoveType
 
 
 class Game(metaclass=Singleton):
@@ -46,16 +52,30 @@ class Game(metaclass=Singleton):
     STARTING_TREE_DISTANCE: int = None
     STARTING_TREES_ON_EDGES: bool = None
 
+    # undo records kinds, see make() and unmake()
+    _UNDO_PLACE: int = 0  # (kind, index)
+    _UNDO_GROW: int = 1  # (kind, index)
+    _UNDO_REMOVE: int = 2  # (kind, index, size, owner, dormant, father)
+    _UNDO_DORMANT: int = 3  # (kind, index, was dormant)
+
     def __init__(self):
         # public
         self.nutrients: int = None
         self.board: py.board.Board = None
-        self.trees: Dict[int, py.tree.Tree] = None
+        # trees by cell index, see getTree() for a Tree view of a cell
+        self.treeSizes: List[int] = None  # -1 when there is no tree
+        self.treeOwners: List[int] = None  # player index, -1 when no tree
+        self.treeDormant: List[bool] = None
+        self.treeFathers: List[int] = None  # -1 when not planted as a seed
+        self.treeCounts: List[List[int]] = None  # [owner][size]
         self.dyingTrees: List[py.cube_coord.CubeCoord] = None
         self.availableSun: List[int] = None
         self.sentSeeds: List[py.seed.Seed] = None
         self.sun: py.sun.Sun = None
-        self.shadows: Dict[int, int] = None
+        self.shadows: py.shadow_map.ShadowMap = None
+        self.zobrist: py.zobrist.Zobrist = None
+        self.sunForecast: py.sun_forecast.SunForecast = None
+        self.treesHash: int = None  # xor of the zobrist keys of the trees
         self.cells: List[py.cell.Cell] = None
         self.random: Random = None
         self.round: int = None
@@ -63,14 +83,27 @@ class Game(metaclass=Singleton):
         self.currentFrameType: py.frame_type.FrameType = None
         self.nextFrameType: py.frame_type.FrameType = None
 
+        # raise the py.exception classes on invalid actions, as the protocol
+        # referee reports them, instead of the faster validateAction path
+        self.raiseActionErrors: bool = True
+
         # private
+        self._undoRecords: List[Tuple] = list()
+        self._undoMarks: List[Tuple] = list()
         # self._gameManager: MultiplayerGameManager<py.player.Player> = None #@Inject private
         self._gameManager: MultiplayerGameManager = None  # @Inject private
         self._gameSummaryManager: py.game_summary_manager.GameSummaryManager = (
             None  # @Inject private
         )
 
-    def init(self, seed: int):
+    def init(self, seed: int, randomFactory: Callable[[int], Random] = Random):
+        """
+        `randomFactory` builds the generator of the game from the seed. The
+        default is the Java-compatible Random of the referee; any object with
+        the same nextInt, shuffle, getState and setState methods can be used
+        when compatibility with the Java engine is not needed, for instance a
+        py.numpy_random.NumpyRandom.
+        """
 
         if self._gameManager.getLeagueLevel() == 1:
             # Wood 2
@@ -98,36 +131,52 @@ class Game(metaclass=Singleton):
 
         else:
             # Bronze+
-            Game.MAX_ROUNDS = py.config.Config.Game.MAX_ROUNDS
+            Game.MAX_ROUNDS = py.config.Config.MAX_ROUNDS
             Game.ENABLE_SEED = True
             Game.ENABLE_GROW = True
             Game.ENABLE_SHADOW = True
             Game.ENABLE_HOLES = True
-            Game.STARTING_TREE_COUNT = py.constants.Constants.Game.STARTING_TREE_COUNT
+            Game.STARTING_TREE_COUNT = py.constants.Constants.STARTING_TREE_COUNT
             Game.STARTING_TREE_SIZE = py.constants.Constants.TREE_SMALL
             Game.STARTING_TREE_DISTANCE = 2
             Game.STARTING_TREES_ON_EDGES = True
 
+        self.raiseActionErrors = True
+        self.random = randomFactory(seed)
         self.nutrients = py.config.Config.STARTING_NUTRIENTS
         self.board = py.board_generator.BoardGenerator.generate(self.random)
-        self.trees = dict()  # TreeMap<>()
+        # TreeMap<>() : trees are iterated by increasing cell index
+        cellCount: int = len(self.board.cells)
+        self.treeSizes = [-1] * cellCount
+        self.treeOwners = [-1] * cellCount
+        self.treeDormant = [False] * cellCount
+        self.treeFathers = [-1] * cellCount
+        self.treeCounts = [
+            [0] * (py.constants.Constants.TREE_TALL + 1)
+            for _ in range(self._gameManager.getPlayerCount())
+        ]
         self.dyingTrees = list()
         # ArrayList<>(self._gameManager.getPlayerCount()) # CHECK
         self.availableSun = list()
         self.sentSeeds = list()
         self.sun = py.sun.Sun()
-        self.shadows = dict()
+        self.shadows = py.shadow_map.ShadowMap(self.board)
+        # built with the board, which generated boards share between games
+        self.zobrist = self.board.zobrist
+        self.sunForecast = py.sun_forecast.SunForecast(
+            self.board, shadows=Game.ENABLE_SHADOW
+        )
+        self.treesHash = 0
         self.cells = list()
-        self.random = Random(seed)
         self.round = 0
         self.turn = 0
         self.currentFrameType = py.frame_type.FrameType.INIT
         self.nextFrameType = py.frame_type.FrameType.GATHERING
+        self._undoRecords = list()
+        self._undoMarks = list()
 
         self.initStartingTrees()
         self.sun.setOrientation(0)
-        if Game.ENABLE_SHADOW:
-            self._calculateShadows()
 
     @staticmethod
     def getExpected() -> str:
@@ -139,11 +188,14 @@ class Game(metaclass=Singleton):
 
         return "SEED <from> <to> | GROW <idx> | COMPLETE <idx> | WAIT"
 
-    def _getCoordByIndex(self, index: int) -> py.cube_coord.CubeCoord:
-        for cubecoord, cell in self.board.map.items():
-            if cell.getIndex() == index:
-                return cubecoord
-        raise CellNotFoundException(index)
+    @staticmethod
+    def isMoveEnabled(moveType: MoveType) -> bool:
+        """Whether the league allows the move, for every engine."""
+        if moveType == MoveType.GROW:
+            return Game.ENABLE_GROW
+        if moveType == MoveType.SEED:
+            return Game.ENABLE_SEED
+        return True
 
     def initStartingTrees(self):
 
@@ -157,7 +209,7 @@ class Game(metaclass=Singleton):
 
         startingCoords = [
             coord
-            for coord in self.board.coords
+            for coord in startingCoords
             if self.board.map[coord].getRichness()
             != py.constants.Constants.RICHNESS_NULL
         ]
@@ -170,12 +222,12 @@ class Game(metaclass=Singleton):
         for i in range(Game.STARTING_TREE_COUNT):
             self._placeTree(
                 players[0],
-                self.board.map[validCoords.get(2 * i)].getIndex(),
+                self.board.map[validCoords[2 * i]].getIndex(),
                 Game.STARTING_TREE_SIZE,
             )
             self._placeTree(
                 players[1],
-                self.board.map[validCoords.get(2 * i + 1)].getIndex(),
+                self.board.map[validCoords[2 * i + 1]].getIndex(),
                 Game.STARTING_TREE_SIZE,
             )
 
@@ -183,38 +235,34 @@ class Game(metaclass=Singleton):
         self, startingCoords: List[py.cube_coord.CubeCoord]
     ) -> List[py.cube_coord.CubeCoord]:
         coordinates: List[py.cube_coord.CubeCoord] = list()
+        distances: bytes = self.board.distances
+        cellCount: int = len(self.board.cells)
         for i in range(Game.STARTING_TREE_COUNT):
             if not startingCoords:
                 return coordinates
             r: int = self.random.nextInt(len(startingCoords))
             normalCoord: py.cube_coord.CubeCoord = startingCoords[r]
             oppositeCoord: py.cube_coord.CubeCoord = normalCoord.getOpposite()
+            normal: int = self.board.map[normalCoord].getIndex() * cellCount
+            opposite: int = self.board.map[oppositeCoord].getIndex() * cellCount
             startingCoords = [
                 coord
                 for coord in startingCoords
                 if not (
-                    coord.distanceTo(normalCoord) <= Game.STARTING_TREE_DISTANCE
-                    or coord.distanceTo(oppositeCoord) <= Game.STARTING_TREE_DISTANCE
+                    distances[normal + self.board.map[coord].getIndex()]
+                    <= Game.STARTING_TREE_DISTANCE
+                    or distances[opposite + self.board.map[coord].getIndex()]
+                    <= Game.STARTING_TREE_DISTANCE
                 )
             ]
             coordinates.append(normalCoord)
             coordinates.append(oppositeCoord)
         return coordinates
 
-    def _calculateShadows(self):
-        self.shadows.clear()
-        for index, tree in self.trees.items():
-            coord: py.cube_coord.CubeCoord = self.board.coords[index]
-            for i in range(1, tree.getSize() + 1):
-                tempCoord: py.cube_coord.CubeCoord = coord.neighbor(
-                    self.sun.getOrientation(), i
-                )
-                if tempCoord in self.board.map:
-                    key: int = self.board.map[tempCoord].getIndex()
-                    value: int = max(
-                        self.shadows.get(key, tree.getSize()), tree.getSize()
-                    )  # CHECK
-                    self.shadows[key] = value
+    def _getShadowLevels(self) -> List[int]:
+        if not Game.ENABLE_SHADOW:
+            return [0] * len(self.board.coords)
+        return self.shadows.getLevels(self.sun.getOrientation())
 
     def _getBoardEdges(self) -> List[py.cube_coord.CubeCoord]:
         return [
@@ -234,17 +282,19 @@ class Game(metaclass=Singleton):
         lines.append(
             f"{other.getSun()} {other.getScore()} {1 if other.isWaiting() else 0}"
         )
-        lines.append(f"{len(self.trees)}")
-
-        for index, tree in self.trees.items():
-            lines.append(
-                "{} {} {} {}".format(
-                    index,
-                    tree.getSize(),
-                    1 if (tree.getOwner() == player) else 0,
-                    1 if tree.isDormant() else 0,
+        lines.append(f"{self.getTreeCount()}")
+
+        playerIndex: int = player.getIndex()
+        for index, size in enumerate(self.treeSizes):
+            if size >= 0:
+                lines.append(
+                    "{} {} {} {}".format(
+                        index,
+                        size,
+                        1 if (self.treeOwners[index] == playerIndex) else 0,
+                        1 if self.treeDormant[index] else 0,
+                    )
                 )
-            )
 
         possibleMoves: List[str] = self._getPossibleMoves(player)
         lines.append(str(len(possibleMoves)))
@@ -253,71 +303,84 @@ class Game(metaclass=Singleton):
 
         return lines
 
-    def _getCoordsInRange(
-        self, center: py.cube_coord.CubeCoord, N: int
-    ) -> List[py.cube_coord.CubeCoord]:
-        results: List[py.cube_coord.CubeCoord] = list()
-        for x in range(-N, N + 1):
-            for y in range(max(-N, -x - N), min(+N, -x + N) + 1):
-                z: int = -x - y
-                results.append(
-                    py.cube_coord.CubeCoord.cubeAdd(
-                        center, py.cube_coord.CubeCoord(x, y, z)
-                    )
-                )
-        return results
-
     def _getPossibleMoves(self, player: py.player.Player) -> List[str]:
         lines: List[str] = list()
         lines.append("WAIT")
 
-        possibleSeeds: List[str] = list()
-        possibleGrows: List[str] = list()
-        possibleCompletes: List[str] = list()
-
         if player.isWaiting():
             return lines
 
-        # For each tree, where they can seed.
-        # For each tree, if they can grow.
-        seedCost: int = self._getSeedCost(player)
-        for index, tree in [
-            (index, tree)
-            for (index, tree) in self.trees.items()
-            if tree.getOwner() == player
-        ]:
-            coord: py.cube_coord.CubeCoord = self.board.coords.get(index)
-
-            if self._playerCanSeedFrom(player, tree, seedCost):
-                for targetCoord in self._getCoordsInRange(coord, tree.getSize()):
-                    targetCell: py.cell.Cell = self.board.map.get(
-                        targetCoord, py.cell.Cell.NO_CELL
-                    )
-                    if self._playerCanSeedTo(targetCell, player):
-                        possibleSeeds.append(f"SEED {index} {targetCell.getIndex()}")
-
-            growCost: int = self._getGrowthCost(tree)
-            if growCost <= player.getSun() and not tree.isDormant():
-                if tree.getSize() == py.constants.Constants.TREE_TALL:
-                    possibleCompletes.append(f"COMPLETE {index}")
-                elif Game.ENABLE_GROW:
-                    possibleGrows.append(f"GROW {index}")
-
-        for possibleList in (possibleCompletes, possibleGrows, possibleSeeds):
+        for moveType, fmt in (
+            (MoveType.COMPLETE, "COMPLETE {2}"),
+            (MoveType.GROW, "GROW {2}"),
+            (MoveType.SEED, "SEED {1} {2}"),
+        ):
+            possibleList: List[str] = [
+                fmt.format(*move) for move in self.generateMoves(player, (moveType,))
+            ]
             Collections.shuffle(possibleList, self.random)
             # CHECK
             lines.extend(possibleList)
 
         return lines
 
+    def generateMoves(
+        self, player: py.player.Player, moveTypes: Container[MoveType] = None
+    ) -> Iterator[Move]:
+        """
+        Lazily yields the possible moves as (type, sourceId, targetId) tuples,
+        unshuffled : WAIT, then the COMPLETE, GROW and SEED moves in the order
+        of the trees. `moveTypes` restricts the types generated.
+        """
+        if moveTypes is None or MoveType.WAIT in moveTypes:
+            yield (MoveType.WAIT, -1, -1)
+
+        if player.isWaiting():
+            return
+
+        playerIndex: int = player.getIndex()
+        owned: List[int] = [
+            index
+            for (index, owner) in enumerate(self.treeOwners)
+            if owner == playerIndex
+        ]
+        sizes: List[int] = self.treeSizes
+        dormant: List[bool] = self.treeDormant
+
+        if moveTypes is None or MoveType.COMPLETE in moveTypes:
+            for index in owned:
+                if (
+                    sizes[index] == py.constants.Constants.TREE_TALL
+                    and not dormant[index]
+                    and self._getGrowthCost(index) <= player.getSun()
+                ):
+                    yield (MoveType.COMPLETE, -1, index)
+
+        if Game.ENABLE_GROW and (moveTypes is None or MoveType.GROW in moveTypes):
+            for index in owned:
+                if (
+                    sizes[index] < py.constants.Constants.TREE_TALL
+                    and not dormant[index]
+                    and self._getGrowthCost(index) <= player.getSun()
+                ):
+                    yield (MoveType.GROW, -1, index)
+
+        if moveTypes is None or MoveType.SEED in moveTypes:
+            seedCost: int = self._getSeedCost(player)
+            for index in owned:
+                if self._playerCanSeedFrom(player, index, seedCost):
+                    for targetIndex in self.board.getCellsInRange(index, sizes[index]):
+                        if self.playerCanSeedTo(self.board.cells[targetIndex], player):
+                            yield (MoveType.SEED, index, targetIndex)
+
     def _playerCanSeedFrom(
-        self, player: py.player.Player, tree: py.tree.Tree, seedCost: int
+        self, player: py.player.Player, index: int, seedCost: int
     ) -> bool:
         return (
             Game.ENABLE_SEED
             and (seedCost <= player.getSun())
-            and (tree.getSize() > py.constants.Constants.TREE_SEED)
-            and (not tree.isDormant())
+            and (self.treeSizes[index] > py.constants.Constants.TREE_SEED)
+            and (not self.treeDormant[index])
         )
 
     def playerCanSeedTo(
@@ -326,7 +389,7 @@ class Game(metaclass=Singleton):
         return (
             targetCell.isValid()
             and (targetCell.getRichness() != py.constants.Constants.RICHNESS_NULL)
-            and (targetCell.getIndex() not in self.trees)
+            and (self.treeSizes[targetCell.getIndex()] < 0)
         )
 
     def getGlobalInfoFor(self, player: py.player.Player) -> List[str]:
@@ -336,17 +399,18 @@ class Game(metaclass=Singleton):
         for coord in self.board.coords:
             cell: py.cell.Cell = self.board.map[coord]
             lines.append(
-                f"{cell.getIndex()} {cell.getRichness()} {self._getNeighbourIds(coord)}"
+                f"{cell.getIndex()} {cell.getRichness()} {self.getNeighbourIds(coord)}"
             )
 
         return lines
 
     def getNeighbourIds(self, coord: py.cube_coord.CubeCoord) -> str:
+        index: int = self.board.map[coord].getIndex()
         orderedNeighborIds: List[int] = [
-            self.board.map.get(coord.neighbor(i), py.cell.Cell.NO_CELL).getIndex()
+            self.board.getNeighbourIndex(index, i)
             for i in range(len(py.cube_coord.CubeCoord.directions))
         ]
-        return " ".join(orderedNeighborIds)
+        return " ".join(str(i) for i in orderedNeighborIds)
 
     def resetGameTurnData(self):
         self.dyingTrees.clear()
@@ -357,116 +421,187 @@ class Game(metaclass=Singleton):
             player.reset()
         self.currentFrameType = self.nextFrameType
 
-    def _getGrowthCost(self, targetTree: py.tree.Tree) -> int:
-        targetSize: int = targetTree.getSize() + 1
+    def _getGrowthCost(self, index: int) -> int:
+        targetSize: int = self.treeSizes[index] + 1
         if targetSize > py.constants.Constants.TREE_TALL:
             return py.constants.Constants.LIFECYCLE_END_COST
-        return self._getCostFor(targetSize, targetTree.getOwner())
+        baseCost: int = py.constants.Constants.TREE_BASE_COST[targetSize]
+        return baseCost + self.treeCounts[self.treeOwners[index]][targetSize]
 
     def _getSeedCost(self, player: py.player.Player) -> int:
         return self._getCostFor(0, player)
 
-    def _doGrow(self, player: py.player.Player, action: Action):
-        coord: py.cube_coord.CubeCoord = self._getCoordByIndex(action.getTargetId())
-        cell: py.cell.Cell = self.board.map.get(coord)
-        targetTree: py.tree.Tree = self.trees.get(cell.getIndex())
-
-        if targetTree is None:
-            raise TreeNotFoundException(cell.getIndex())
-
-        if targetTree.getOwner() != player:
-            raise NotOwnerOfTreeException(cell.getIndex(), targetTree.getOwner())
-
-        if targetTree.isDormant():
-            raise AlreadyActivatedTree(cell.getIndex())
-
-        if targetTree.getSize() >= py.constants.Constants.TREE_TALL:
-            raise TreeAlreadyTallException(cell.getIndex())
+    def validateAction(self, player: py.player.Player, action: Action) -> ActionError:
+        """
+        Checks an action without raising, in the order the _do* methods do.
+        WAIT and NO_ACTION are always valid.
+        """
+        if action.isGrow():
+            return self.validateGrow(player, action)
+        if action.isSeed():
+            return self.validateSeed(player, action)
+        if action.isComplete():
+            return self.validateComplete(player, action)
+        return ActionError.NONE
+
+    def validateGrow(self, player: py.player.Player, action: Action) -> ActionError:
+        if not Game.isMoveEnabled(MoveType.GROW):
+            return ActionError.ACTION_NOT_ENABLED
+        index: int = action.getTargetId()
+        if not 0 <= index < len(self.board.cells):
+            return ActionError.CELL_NOT_FOUND
+        if self.treeSizes[index] < 0:
+            return ActionError.TREE_NOT_FOUND
+        if self.treeOwners[index] != player.getIndex():
+            return ActionError.NOT_OWNER_OF_TREE
+        if self.treeDormant[index]:
+            return ActionError.ALREADY_ACTIVATED_TREE
+        if self.treeSizes[index] >= py.constants.Constants.TREE_TALL:
+            return ActionError.TREE_ALREADY_TALL
+        if self.availableSun[player.getIndex()] < self._getGrowthCost(index):
+            return ActionError.NOT_ENOUGH_SUN
+        return ActionError.NONE
+
+    def validateComplete(
+        self, player: py.player.Player, action: Action
+    ) -> ActionError:
+        index: int = action.getTargetId()
+        if not 0 <= index < len(self.board.cells):
+            return ActionError.CELL_NOT_FOUND
+        if self.treeSizes[index] < 0:
+            return ActionError.TREE_NOT_FOUND
+        if self.treeOwners[index] != player.getIndex():
+            return ActionError.NOT_OWNER_OF_TREE
+        if self.treeSizes[index] < py.constants.Constants.TREE_TALL:
+            return ActionError.TREE_NOT_TALL
+        if self.treeDormant[index]:
+            return ActionError.ALREADY_ACTIVATED_TREE
+        if self.availableSun[player.getIndex()] < self._getGrowthCost(index):
+            return ActionError.NOT_ENOUGH_SUN
+        return ActionError.NONE
+
+    def validateSeed(self, player: py.player.Player, action: Action) -> ActionError:
+        if not Game.isMoveEnabled(MoveType.SEED):
+            return ActionError.ACTION_NOT_ENABLED
+        targetIndex: int = action.getTargetId()
+        sourceIndex: int = action.getSourceId()
+        cellCount: int = len(self.board.cells)
+        if not (0 <= targetIndex < cellCount and 0 <= sourceIndex < cellCount):
+            return ActionError.CELL_NOT_FOUND
+        if self.treeSizes[targetIndex] >= 0:
+            return ActionError.CELL_NOT_EMPTY
+        sourceSize: int = self.treeSizes[sourceIndex]
+        if sourceSize < 0:
+            return ActionError.TREE_NOT_FOUND
+        if sourceSize == py.constants.Constants.TREE_SEED:
+            return ActionError.TREE_IS_SEED
+        if self.treeOwners[sourceIndex] != player.getIndex():
+            return ActionError.NOT_OWNER_OF_TREE
+        if self.treeDormant[sourceIndex]:
+            return ActionError.ALREADY_ACTIVATED_TREE
+        distance: int = self.board.getDistance(sourceIndex, targetIndex)
+        if distance > sourceSize:
+            return ActionError.TREE_TOO_FAR
+        if (
+            self.board.cells[targetIndex].getRichness()
+            == py.constants.Constants.RICHNESS_NULL
+        ):
+            return ActionError.CELL_NOT_VALID
+        if self.availableSun[player.getIndex()] < self._getSeedCost(player):
+            return ActionError.NOT_ENOUGH_SUN
+        return ActionError.NONE
+
+    def _getActionException(
+        self, error: ActionError, player: py.player.Player, action: Action
+    ) -> GameException:
+        if error == ActionError.ACTION_NOT_ENABLED:
+            return ActionNotEnabledException("SEED" if action.isSeed() else "GROW")
+        targetIndex: int = action.getTargetId()
+        index: int = targetIndex
+        if action.isSeed():
+            # the other errors of a seed are about its source tree
+            if not (
+                error in (ActionError.CELL_NOT_EMPTY, ActionError.CELL_NOT_VALID)
+                or (
+                    error == ActionError.CELL_NOT_FOUND
+                    and not 0 <= targetIndex < len(self.board.cells)
+                )
+            ):
+                index = action.getSourceId()
+
+        if error == ActionError.CELL_NOT_FOUND:
+            return CellNotFoundException(index)
+        if error == ActionError.TREE_NOT_FOUND:
+            return TreeNotFoundException(index)
+        if error == ActionError.NOT_OWNER_OF_TREE:
+            return NotOwnerOfTreeException(
+                index, self._gameManager.getPlayer(self.treeOwners[index])
+            )
+        if error == ActionError.ALREADY_ACTIVATED_TREE:
+            return AlreadyActivatedTree(index)
+        if error == ActionError.TREE_ALREADY_TALL:
+            return TreeAlreadyTallException(index)
+        if error == ActionError.TREE_NOT_TALL:
+            return TreeNotTallException(index)
+        if error == ActionError.TREE_IS_SEED:
+            return TreeIsSeedException(index)
+        if error == ActionError.CELL_NOT_EMPTY:
+            return CellNotEmptyException(index)
+        if error == ActionError.TREE_TOO_FAR:
+            return TreeTooFarException(action.getSourceId(), targetIndex)
+        if error == ActionError.CELL_NOT_VALID:
+            return CellNotValidException(index)
+        cost: int = (
+            self._getSeedCost(player)
+            if action.isSeed()
+            else self._getGrowthCost(targetIndex)
+        )
+        return NotEnoughSunException(cost, player.getSun())
 
-        costOfGrowth: int = self._getGrowthCost(targetTree)
-        currentSun: int = self.availableSun[player.getIndex()]
-        if currentSun < costOfGrowth:
-            raise NotEnoughSunException(costOfGrowth, player.getSun())
+    def _doGrow(self, player: py.player.Player, action: Action):
+        error: ActionError = self.validateGrow(player, action)
+        if error != ActionError.NONE:
+            raise self._getActionException(error, player, action)
+        self._applyGrow(player, action)
 
-        self.availableSun.set(player.getIndex(), currentSun - costOfGrowth)
+    def _applyGrow(self, player: py.player.Player, action: Action):
+        cell: py.cell.Cell = self.board.cells[action.getTargetId()]
+        self.availableSun[player.getIndex()] -= self._getGrowthCost(cell.getIndex())
 
-        targetTree.grow()
+        self._growTree(cell.getIndex())
         self._gameSummaryManager.addGrowTree(player, cell)
 
-        targetTree.setDormant()
+        self._setDormant(cell.getIndex())
 
     def _doComplete(self, player: py.player.Player, action: Action):
-        coord: py.cube_coord.CubeCoord = self._getCoordByIndex(action.getTargetId())
-        cell: py.cell.Cell = self.board.map[coord]
-        targetTree: py.tree.Tree = self.trees.get(cell.getIndex(), None)
-        if targetTree is None:
-            raise TreeNotFoundException(cell.getIndex())
-
-        if targetTree.getOwner() != player:
-            raise NotOwnerOfTreeException(cell.getIndex(), targetTree.getOwner())
-
-        if targetTree.getSize() < py.constants.Constants.TREE_TALL:
-            raise TreeNotTallException(cell.getIndex())
-
-        if targetTree.isDormant():
-            raise AlreadyActivatedTree(cell.getIndex())
-
-        costOfGrowth: int = self._getGrowthCost(targetTree)
-        currentSun: int = self.availableSun[player.getIndex()]
-        if currentSun < costOfGrowth:
-            raise NotEnoughSunException(costOfGrowth, player.getSun())
+        error: ActionError = self.validateComplete(player, action)
+        if error != ActionError.NONE:
+            raise self._getActionException(error, player, action)
+        self._applyComplete(player, action)
 
-        self.availableSun[player.getIndex()] = currentSun - costOfGrowth
-        self.dyingTrees.append(coord)
-        targetTree.setDormant()
+    def _applyComplete(self, player: py.player.Player, action: Action):
+        index: int = action.getTargetId()
+        self.availableSun[player.getIndex()] -= self._getGrowthCost(index)
+        self.dyingTrees.append(self.board.coords[index])
+        self._setDormant(index)
 
     def _getCostFor(self, size: int, owner: py.player.Player) -> int:
         baseCost: int = py.constants.Constants.TREE_BASE_COST[size]
-        sameTreeCount: int = len(
-            [
-                t
-                for t in self.trees.values()
-                if (t.getSize() == size and t.getOwner() == owner)
-            ]
-        )  # CHECK
+        sameTreeCount: int = self.treeCounts[owner.getIndex()][size]
         return baseCost + sameTreeCount
 
     def _doSeed(self, player: py.player.Player, action: Action):
-        targetCoord: py.cube_coord.CubeCoord = self._getCoordByIndex(
-            action.getTargetId()
-        )
-        sourceCoord: py.cube_coord.CubeCoord = self._getCoordByIndex(
-            action.getSourceId()
-        )
+        error: ActionError = self.validateSeed(player, action)
+        if error != ActionError.NONE:
+            raise self._getActionException(error, player, action)
+        self._applySeed(player, action)
+
+    def _applySeed(self, player: py.player.Player, action: Action):
+        targetCell: py.cell.Cell = self.board.cells[action.getTargetId()]
+        sourceCell: py.cell.Cell = self.board.cells[action.getSourceId()]
 
-        targetCell: py.cell.Cell = self.board.map[targetCoord]
-        sourceCell: py.cell.Cell = self.board.map[sourceCoord]
-
-        # check if the move is possible
-        if self._aTreeIsOn(targetCell):
-            raise CellNotEmptyException(targetCell.getIndex())
-        sourceTree: py.tree.Tree = self.trees.get(sourceCell.getIndex(), None)
-        if sourceTree is None:
-            raise TreeNotFoundException(sourceCell.getIndex())
-        if sourceTree.getSize() == py.constants.Constants.TREE_SEED:
-            raise TreeIsSeedException(sourceCell.getIndex())
-        if sourceTree.getOwner() != player:
-            raise NotOwnerOfTreeException(sourceCell.getIndex(), sourceTree.getOwner())
-        if sourceTree.isDormant():
-            raise AlreadyActivatedTree(sourceCell.getIndex())
-        distance: int = sourceCoord.distanceTo(targetCoord)
-        if distance > sourceTree.getSize():
-            raise TreeTooFarException(sourceCell.getIndex(), targetCell.getIndex())
-        if targetCell.getRichness() == py.constants.Constants.RICHNESS_NULL:
-            raise CellNotValidException(targetCell.getIndex())
-        costOfSeed: int = self._getSeedCost(player)
-        currentSun: int = self.availableSun[player.getIndex()]
-        if currentSun < costOfSeed:
-            raise NotEnoughSunException(costOfSeed, player.getSun())
-
-        # the seed action is valid : do it
-        self.availableSun[player.getIndex()] = currentSun - costOfSeed
-        sourceTree.setDormant()
+        self.availableSun[player.getIndex()] -= self._getSeedCost(player)
+        self._setDormant(sourceCell.getIndex())
         seed: py.seed.Seed = py.seed.Seed()
         seed.setOwner(player.getIndex())
         seed.setSourceCell(sourceCell.getIndex())
@@ -474,23 +609,27 @@ class Game(metaclass=Singleton):
         self.sentSeeds.append(seed)
         self._gameSummaryManager.addPlantSeed(player, targetCell, sourceCell)
 
-    def _aTreeIsOn(self, cell: py.cell.Cell) -> bool:
-        return cell.getIndex() in self.trees
+    @staticmethod
+    def getSunIncome(
+        sizes: List[int], owners: List[int], shadows: List[int]
+    ) -> List[int]:
+        """Sun given to each player by the trees, given the shadow levels."""
+        income: List[int] = [0, 0]
+        for index, size in enumerate(sizes):
+            # an empty cell has size -1, never above its shadow
+            if shadows[index] < size:
+                income[owners[index]] += size
+        return income
 
     def _giveSun(self):
-        givenToPlayer: List[int] = [None, None]
-
-        for index, tree in self.trees.items():
-            if (index not in self.shadows) or (
-                self.shadows[index] < tree.getSize()
-            ):  # CHECK
-                owner: py.player.Player = tree.getOwner()
-                owner.addSun(tree.getSize())
-                givenToPlayer[owner.getIndex()] += tree.getSize()
+        givenToPlayer: List[int] = Game.getSunIncome(
+            self.treeSizes, self.treeOwners, self._getShadowLevels()
+        )
 
         for player in self._gameManager.getPlayers():
             given: int = givenToPlayer[player.getIndex()]
             if given > 0:
+                player.addSun(given)
                 self._gameSummaryManager.addGather(player, given)
 
     def _removeDyingTrees(self):
@@ -502,13 +641,14 @@ class Game(metaclass=Singleton):
             elif cell.getRichness() == py.constants.Constants.RICHNESS_LUSH:
                 points += py.constants.Constants.RICHNESS_BONUS_LUSH
 
-            player: py.player.Player = self.trees[cell.getIndex()].getOwner()
+            player: py.player.Player = self._gameManager.getPlayer(
+                self.treeOwners[cell.getIndex()]
+            )
             player.addScore(points)
             self._gameManager.addTooltip(
                 f"{player.getNicknameToken()} scores {points} points"
             )
-            # self.trees.remove(cell.getIndex()) # CHECK trees in a dict
-            del self.trees[cell.getIndex()]
+            self._removeTree(cell.getIndex())
             self._gameSummaryManager.addCutTree(player, cell, points)
 
     def _updateNutrients(self):
@@ -549,8 +689,6 @@ class Game(metaclass=Singleton):
         self.round += 1
         if self.round < Game.MAX_ROUNDS:
             self.sun.move()
-            if Game.ENABLE_SHADOW:
-                self._calculateShadows()
 
         self._gameManager.setFrameDuration(
             py.constants.Constants.DURATION_SUNMOVE_PHASE
@@ -561,8 +699,15 @@ class Game(metaclass=Singleton):
         for player in self._gameManager.getPlayers():
             player.setWaiting(False)
 
-        for index, tree in self.trees.items():
-            tree.reset()
+        recording: bool = bool(self._undoMarks)
+        dormant: List[bool] = self.treeDormant
+        for index in range(len(dormant)):
+            if dormant[index]:
+                if recording:
+                    self._undoRecords.append((Game._UNDO_DORMANT, index, True))
+                self.treesHash ^= self._getTreeKey(index)
+                dormant[index] = False
+                self.treesHash ^= self._getTreeKey(index)
 
         # Harvest
         self._giveSun()
@@ -572,6 +717,9 @@ class Game(metaclass=Singleton):
     def performActionUpdate(self):
 
         for player in [p for p in self._gameManager.getPlayers() if not p.isWaiting()]:
+            if not self.raiseActionErrors:
+                self._playAction(player, player.getAction())
+                continue
             try:
                 action: Action = player.getAction()
                 if action.isGrow():
@@ -607,6 +755,23 @@ class Game(metaclass=Singleton):
         self._updateNutrients()
         self._gameManager.setFrameDuration(py.constants.Constants.DURATION_ACTION_PHASE)
 
+    def _playAction(self, player: py.player.Player, action: Action):
+        """
+        Exception-free path of performActionUpdate : an invalid action makes
+        the player wait, and no error or wait is added to the game summary.
+        """
+        error: ActionError = self.validateAction(player, action)
+        if error != ActionError.NONE:
+            player.setWaiting(True)
+        elif action.isGrow():
+            self._applyGrow(player, action)
+        elif action.isSeed():
+            self._applySeed(player, action)
+        elif action.isComplete():
+            self._applyComplete(player, action)
+        else:
+            player.setWaiting(True)
+
     def _seedsAreConflicting(self) -> bool:
         return len(set([seed.getTargetCell() for seed in self.sentSeeds])) != len(
             self.sentSeeds
@@ -625,21 +790,294 @@ class Game(metaclass=Singleton):
         )
 
     def _plantSeed(self, player: py.player.Player, index: int, fatherIndex: int):
-        seed: py.tree.Tree = self._placeTree(
-            player, index, py.constants.Constants.TREE_SEED
+        self._placeTree(player, index, py.constants.Constants.TREE_SEED)
+        self._setDormant(index)
+        self.treeFathers[index] = fatherIndex
+
+    def _placeTree(self, player: py.player.Player, index: int, size: int):
+        self.treeSizes[index] = size
+        self.treeOwners[index] = player.getIndex()
+        self.treeCounts[player.getIndex()][size] += 1
+        self.shadows.addTree(index, size)
+        self.treesHash ^= self._getTreeKey(index)
+        if self._undoMarks:
+            self._undoRecords.append((Game._UNDO_PLACE, index))
+
+    def _growTree(self, index: int):
+        size: int = self.treeSizes[index]
+        counts: List[int] = self.treeCounts[self.treeOwners[index]]
+        counts[size] -= 1
+        counts[size + 1] += 1
+        self.shadows.growTree(index, size)
+        self.treesHash ^= self._getTreeKey(index)
+        self.treeSizes[index] = size + 1
+        self.treesHash ^= self._getTreeKey(index)
+        if self._undoMarks:
+            self._undoRecords.append((Game._UNDO_GROW, index))
+
+    def _removeTree(self, index: int):
+        size: int = self.treeSizes[index]
+        if self._undoMarks:
+            self._undoRecords.append(
+                (
+                    Game._UNDO_REMOVE,
+                    index,
+                    size,
+                    self.treeOwners[index],
+                    self.treeDormant[index],
+                    self.treeFathers[index],
+                )
+            )
+        self.treeCounts[self.treeOwners[index]][size] -= 1
+        self.shadows.removeTree(index, size)
+        self.treesHash ^= self._getTreeKey(index)
+        self._clearCell(index)
+
+    def _clearCell(self, index: int):
+        self.treeSizes[index] = -1
+        self.treeOwners[index] = -1
+        self.treeDormant[index] = False
+        self.treeFathers[index] = -1
+
+    def _setDormant(self, index: int):
+        if self._undoMarks:
+            self._undoRecords.append(
+                (Game._UNDO_DORMANT, index, self.treeDormant[index])
+            )
+        if not self.treeDormant[index]:
+            self.treesHash ^= self._getTreeKey(index)
+            self.treeDormant[index] = True
+            self.treesHash ^= self._getTreeKey(index)
+
+    def _getTreeKey(self, index: int) -> int:
+        return self.zobrist.getTreeKey(
+            index,
+            self.treeOwners[index],
+            self.treeSizes[index],
+            self.treeDormant[index],
         )
-        seed.setDormant()
-        seed.setFatherIndex(fatherIndex)
 
-    def _placeTree(
-        self, player: py.player.Player, index: int, size: int
-    ) -> py.tree.Tree:
+    def getTreeCount(self) -> int:
+        return sum(sum(counts) for counts in self.treeCounts)
+
+    def getTree(self, index: int) -> py.tree.Tree:
+        """Tree view of a cell, None when there is no tree on it."""
+        if self.treeSizes[index] < 0:
+            return None
         tree: py.tree.Tree = py.tree.Tree()
-        tree.setSize(size)
-        tree.setOwner(player)
-        self.trees[index] = tree
+        tree.setSize(self.treeSizes[index])
+        tree.setOwner(self._gameManager.getPlayer(self.treeOwners[index]))
+        tree.setFatherIndex(self.treeFathers[index])
+        if self.treeDormant[index]:
+            tree.setDormant()
+        else:
+            tree.reset()
         return tree
 
+    def getHash(self) -> int:
+        """
+        Zobrist hash of the state : the trees, sun orientation, round,
+        nutrients and the sun, score and waiting flag of each player.
+        """
+        return self.zobrist.getHash(
+            self.treesHash,
+            self.sun.getOrientation(),
+            self.round,
+            self.nutrients,
+            [
+                (player.getSun(), player.getScore(), player.isWaiting())
+                for player in self._gameManager.getPlayers()
+            ],
+        )
+
+    def getSunForecast(self, moves: int = 6) -> Tuple[List[int], ...]:
+        """
+        Sun each player would gather on the next `moves` sun moves, from the
+        current orientation on, if the trees stayed as they are.
+        """
+        return self.sunForecast.forecast(
+            self.treeSizes, self.treeOwners, self.sun.getOrientation(), moves
+        )
+
+    def make(self, actions: List[Action]):
+        """
+        Plays an action frame with one action per player, followed by the sun
+        move and gathering frames when every player is then waiting, so the
+        game is at an action frame again. Only the changes are recorded, and
+        unmake() reverts them, including the frame make() was called in. The
+        game summary of these frames is dropped.
+        """
+        players: List[py.player.Player] = self._gameManager.getPlayers()
+        self._undoMarks.append(
+            (
+                len(self._undoRecords),
+                self.nutrients,
+                self.round,
+                self.turn,
+                self.sun.getOrientation(),
+                tuple(
+                    (player.getSun(), player.getScore(), player.isWaiting())
+                    for player in players
+                ),
+                self.currentFrameType,
+                self.nextFrameType,
+                # the current frame, in case make() is called in the middle of it
+                list(self.availableSun),
+                list(self.dyingTrees),
+                list(self.sentSeeds),
+                tuple(player.getAction() for player in players),
+            )
+        )
+        summaryLength: int = self._gameSummaryManager.getLineCount()
+
+        self.dyingTrees.clear()
+        self.sentSeeds.clear()
+        self.availableSun.clear()
+        for player, action in zip(players, actions):
+            self.availableSun.append(player.getSun())
+            player.setAction(action)
+
+        self.turn += 1
+        self.currentFrameType = py.frame_type.FrameType.ACTIONS
+        self.performActionUpdate()
+        if self._allPlayersAreWaiting():
+            self.turn += 1
+            self.round += 1
+            if self.round < Game.MAX_ROUNDS:
+                self.sun.move()
+                self.turn += 1
+                self.performSunGatheringUpdate()
+        self.nextFrameType = py.frame_type.FrameType.ACTIONS
+        self._gameSummaryManager.truncate(summaryLength)
+
+    def unmake(self):
+        """Reverts the last make()."""
+        (
+            start,
+            self.nutrients,
+            self.round,
+            self.turn,
+            orientation,
+            playerStates,
+            self.currentFrameType,
+            self.nextFrameType,
+            self.availableSun,
+            self.dyingTrees,
+            self.sentSeeds,
+            actions,
+        ) = self._undoMarks.pop()
+        records: List[Tuple] = self._undoRecords
+
+        while len(records) > start:
+            record: Tuple = records.pop()
+            kind: int = record[0]
+            index: int = record[1]
+            if kind == Game._UNDO_REMOVE:
+                (
+                    _,
+                    _,
+                    size,
+                    owner,
+                    self.treeDormant[index],
+                    self.treeFathers[index],
+                ) = record
+                self.treeSizes[index] = size
+                self.treeOwners[index] = owner
+                self.treeCounts[owner][size] += 1
+                self.shadows.addTree(index, size)
+                self.treesHash ^= self._getTreeKey(index)
+                continue
+
+            size: int = self.treeSizes[index]
+            self.treesHash ^= self._getTreeKey(index)
+            if kind == Game._UNDO_DORMANT:
+                self.treeDormant[index] = record[2]
+            elif kind == Game._UNDO_PLACE:
+                self.treeCounts[self.treeOwners[index]][size] -= 1
+                self.shadows.removeTree(index, size)
+                self._clearCell(index)
+                continue
+            else:
+                counts: List[int] = self.treeCounts[self.treeOwners[index]]
+                counts[size] -= 1
+                counts[size - 1] += 1
+                self.shadows.removeTree(index, size)
+                self.shadows.addTree(index, size - 1)
+                self.treeSizes[index] = size - 1
+            self.treesHash ^= self._getTreeKey(index)
+
+        self.sun.setOrientation(orientation)
+        for player, (sun, score, waiting), action in zip(
+            self._gameManager.getPlayers(), playerStates, actions
+        ):
+            player.setSun(sun)
+            player.setScore(score)
+            player.setWaiting(waiting)
+            player.setAction(action)
+
+    def snapshot(self) -> Tuple:
+        """
+        Compact immutable copy of the game state, to be given to restore().
+        """
+        return (
+            (
+                tuple(self.treeSizes),
+                tuple(self.treeOwners),
+                tuple(self.treeDormant),
+                tuple(self.treeFathers),
+            ),
+            tuple(tuple(counts) for counts in self.treeCounts),
+            self.shadows.snapshot(),
+            self.sun.getOrientation(),
+            self.nutrients,
+            self.round,
+            self.turn,
+            tuple(
+                (player.getSun(), player.getScore(), player.isWaiting())
+                for player in self._gameManager.getPlayers()
+            ),
+            tuple(self.availableSun),
+            self.currentFrameType,
+            self.nextFrameType,
+            self.random.getState(),
+        )
+
+    def restore(self, snapshot: Tuple):
+        (
+            trees,
+            treeCounts,
+            shadows,
+            orientation,
+            self.nutrients,
+            self.round,
+            self.turn,
+            playerStates,
+            availableSun,
+            self.currentFrameType,
+            self.nextFrameType,
+            randomState,
+        ) = snapshot
+        players: List[py.player.Player] = self._gameManager.getPlayers()
+
+        self.treeSizes = list(trees[0])
+        self.treeOwners = list(trees[1])
+        self.treeDormant = list(trees[2])
+        self.treeFathers = list(trees[3])
+        self.treeCounts = [list(counts) for counts in treeCounts]
+        self.shadows.restore(shadows)
+        self.treesHash = 0
+        for index, size in enumerate(self.treeSizes):
+            if size >= 0:
+                self.treesHash ^= self._getTreeKey(index)
+        self.sun.setOrientation(orientation)
+
+        for player, (sun, score, waiting) in zip(players, playerStates):
+            player.setSun(sun)
+            player.setScore(score)
+            player.setWaiting(waiting)
+        self.availableSun = list(availableSun)
+        self.random.setState(randomState)
+
     def onEnd(self):
         for player in self._gameManager.getActivePlayers():
             player.addScore(int(player.getSun() // 3))
@@ -657,23 +1095,30 @@ class Game(metaclass=Singleton):
             == 1
         ):
 
-            for index, tree in self.trees.items():
-                if tree.getOwner().isActive():
-                    tree.getOwner().addBonusScore(1)
-                    tree.getOwner().addScore(1)
+            for owner in self.treeOwners:
+                if owner >= 0 and self._gameManager.getPlayer(owner).isActive():
+                    self._gameManager.getPlayer(owner).addBonusScore(1)
+                    self._gameManager.getPlayer(owner).addScore(1)
 
     def getBoard(self) -> Dict[py.cube_coord.CubeCoord, py.cell.Cell]:
         return self.board.map
 
     def getTrees(self) -> Dict[int, py.tree.Tree]:
-        return self.trees
+        """Tree views of the trees, by increasing cell index."""
+        return {
+            index: self.getTree(index)
+            for (index, size) in enumerate(self.treeSizes)
+            if size >= 0
+        }
 
     def getShadows(self) -> Dict[int, int]:
-        return self.shadows
+        if not Game.ENABLE_SHADOW:
+            return dict()
+        return self.shadows.asDict(self.sun.getOrientation())
 
     def _gameOver(self) -> bool:
         # CHECK
-        return (self._gameManager.getActivePlayers().size() <= 1) or (
+        return (len(self._gameManager.getActivePlayers()) <= 1) or (
             self.round >= Game.MAX_ROUNDS
         )
 
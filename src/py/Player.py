@@ -6,7 +6,10 @@ import py.config
 
 
 class Player(AbstractMultiplayerPlayer):
+    __slots__ = ("_message", "_action", "_sun", "_waiting", "_bonusScore")
+
     def __init__(self):
+        super().__init__()
         self._message: str = None
         self._action: Action = Action.NO_ACTION
         self._sun: int = py.config.Config.STARTING_SUN
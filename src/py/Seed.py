@@ -2,6 +2,8 @@
 
 class Seed:
 
+    __slots__ = ("_owner", "_sourceCell", "_targetCell")
+
     def __init__(self):
         self._owner : int = None
         self._sourceCell : int = None
@@ -20,7 +22,7 @@ class Seed:
     
 
     def setSourceCell(self, sourceCell: int):
-        self.sourceCell = sourceCell
+        self._sourceCell = sourceCell
     
 
     def getTargetCell(self) -> int:
@@ -28,7 +30,7 @@ class Seed:
     
 
     def setTargetCell(self, targetCell: int):
-        self.targetCell = targetCell
+        self._targetCell = targetCell
     
 
 
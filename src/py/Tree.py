@@ -2,6 +2,13 @@ import py.player
 
 
 class Tree:
+    """
+    View of a tree built by Game.getTree. The game itself stores the trees
+    in arrays indexed by cell.
+    """
+
+    __slots__ = ("_size", "_owner", "_fatherIndex", "_isDormant")
+
     def __init__(self):
         self._size: int = None
         self._owner: py.player.Player = None
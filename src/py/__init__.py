@@ -1,3 +1,5 @@
+import py.action_error
+import py.bitboard
 import py.board
 import py.board_generator
 import py.cell
@@ -5,17 +7,32 @@ import py.command_manager
 import py.config
 import py.constants
 import py.cube_coord
+import py.event_type
+import py.forward_model
 import py.frame_type
 import py.game
 import py.game_summary_manager
 import py.growth
+import py.headless_runner
 import py.invalid_input_exception
+import py.move_type
 import py.player
 import py.referee
 import py.seed
+import py.shadow_map
 import py.sun
+import py.sun_forecast
+import py.symmetry
+import py.transposition_table
 import py.tree
+import py.zobrist
 
+# py.batch_game and py.numpy_random need numpy, which the rest of the
+# engine does not depend on : they are not imported here, import them
+# explicitly
+
+ActionError = py.action_error.ActionError
+Bitboard = py.bitboard.Bitboard
 Board = py.board.Board
 BoardGenerator = py.board_generator.BoardGenerator
 Cell = py.cell.Cell
@@ -23,16 +40,25 @@ CommandManager = py.command_manager.CommandManager
 Config = py.config.Config
 Constants = py.constants.Constants
 CubeCoord = py.cube_coord.CubeCoord
+EventType = py.event_type.EventType
+ForwardModel = py.forward_model.ForwardModel
 FrameType = py.frame_type.FrameType
 Game = py.game.Game
 GameSummaryManager = py.game_summary_manager.GameSummaryManager
 Growth = py.growth.Growth
+HeadlessRunner = py.headless_runner.HeadlessRunner
 InvalidInputException = py.invalid_input_exception.InvalidInputException
+MoveType = py.move_type.MoveType
 Player = py.player.Player
 Referee = py.referee.Referee
 Seed = py.seed.Seed
+ShadowMap = py.shadow_map.ShadowMap
 Sun = py.sun.Sun
+SunForecast = py.sun_forecast.SunForecast
+Symmetry = py.symmetry.Symmetry
+TranspositionTable = py.transposition_table.TranspositionTable
 Tree = py.tree.Tree
+Zobrist = py.zobrist.Zobrist
 
 
 import py.java.compat
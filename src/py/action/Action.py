@@ -1,14 +1,50 @@
 import abc
 
+
+def _newAction(cls, sourceId: int, targetId: int) -> "Action":
+    action: Action = object.__new__(cls)
+    Action.__init__(action, sourceId, targetId)
+    return action
+
+
 class Action(abc.ABC):
+    """
+    Immutable value type : actions with the same type and ids are equal.
+    Ids not used by the action type are -1.
+    """
 
-    NO_ACTION = None #Action()
+    __slots__ = ("sourceId", "targetId")
+
+    NO_ACTION = None  # set below the class
     #public static final Action NO_ACTION = new Action() {
     #}
 
-    def __init__(self):
-        self.sourceId : int
-        self.targetId : int
+    def __init__(self, sourceId: int = -1, targetId: int = -1):
+        object.__setattr__(self, "sourceId", sourceId)
+        object.__setattr__(self, "targetId", targetId)
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other) -> bool:
+        return (
+            type(self) is type(other)
+            and self.sourceId == other.sourceId
+            and self.targetId == other.targetId
+        )
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.sourceId, self.targetId))
+
+    def __reduce__(self):
+        # the subclasses take different constructor arguments
+        return (_newAction, (type(self), self.sourceId, self.targetId))
+
+    def __copy__(self) -> "Action":
+        return self
+
+    def __deepcopy__(self, memo) -> "Action":
+        return self
 
 
     def isGrow(self) -> bool:
@@ -34,3 +70,6 @@ class Action(abc.ABC):
     def getTargetId(self) -> int:
         return self.targetId
 
+
+
+Action.NO_ACTION = Action()
@@ -2,8 +2,10 @@ from .Action import Action
 
 
 class GrowAction(Action):
+    __slots__ = ()
+
     def __init__(self, targetId: int):
-        self.targetId = targetId
+        super().__init__(targetId=targetId)
 
     def isGrow(self) -> bool:
         return True
@@ -2,9 +2,10 @@ from .Action import Action
 
 
 class SeedAction(Action):
+    __slots__ = ()
+
     def __init__(self, sourceId: int, targetId: int):
-        self.sourceId = sourceId
-        self.targetId = targetId
+        super().__init__(sourceId, targetId)
 
     def isSeed(self) -> bool:
         return True
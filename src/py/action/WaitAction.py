@@ -2,5 +2,7 @@ from .Action import Action
 
 
 class WaitAction(Action):
+    __slots__ = ()
+
     def isWait(self) -> bool:
         return True
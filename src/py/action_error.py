@@ -0,0 +1,22 @@
+from enum import IntEnum
+
+
+class ActionError(IntEnum):
+    """
+    Result of the exception-free action validation of Game, each error
+    matching one of the py.exception classes.
+    """
+
+    NONE = 0
+    CELL_NOT_FOUND = 1  # CellNotFoundException
+    TREE_NOT_FOUND = 2  # TreeNotFoundException
+    NOT_OWNER_OF_TREE = 3  # NotOwnerOfTreeException
+    ALREADY_ACTIVATED_TREE = 4  # AlreadyActivatedTree
+    TREE_ALREADY_TALL = 5  # TreeAlreadyTallException
+    TREE_NOT_TALL = 6  # TreeNotTallException
+    TREE_IS_SEED = 7  # TreeIsSeedException
+    CELL_NOT_EMPTY = 8  # CellNotEmptyException
+    TREE_TOO_FAR = 9  # TreeTooFarException
+    CELL_NOT_VALID = 10  # CellNotValidException
+    NOT_ENOUGH_SUN = 11  # NotEnoughSunException
+    ACTION_NOT_ENABLED = 12  # ActionNotEnabledException
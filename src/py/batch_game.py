@@ -0,0 +1,251 @@
+from typing import List
+
+import numpy as np
+
+import py.bitboard
+import py.board
+import py.constants
+import py.game
+from py.move_type import MoveType
+
+
+class BatchGame:
+    """
+    N games on boards of the same shape, advanced in lockstep with NumPy.
+    Each game state is a row of the arrays below. Actions are given as an
+    (N, 2) array of moves encoded by BatchGame.encode. Games are loaded
+    from bitboards, one row each, with fromBitboards or setGame.
+    """
+
+    def __init__(self, board: py.board.Board, count: int):
+        cellCount: int = len(board.cells)
+        self.board: py.board.Board = board
+        self.count: int = count
+        self.cellCount: int = cellCount
+        self._rows: np.ndarray = np.arange(count)
+
+        # shadow sources : cell at distance 1-3 casting a shadow on each cell
+        # for each sun orientation, cellCount when off-board
+        rays: np.ndarray = np.array(board.rays, dtype=np.int64).reshape(
+            cellCount, 6, 3
+        )[:, [(orientation + 3) % 6 for orientation in range(6)], :]
+        self._sources: np.ndarray = np.where(rays < 0, cellCount, rays)
+
+        self._distances: np.ndarray = np.frombuffer(
+            board.distances, dtype=np.int8
+        ).reshape(cellCount, cellCount)
+
+        self._baseCost: np.ndarray = np.array(
+            py.constants.Constants.TREE_BASE_COST + (0,), dtype=np.int32
+        )
+        self._richnessBonus: np.ndarray = np.zeros(4, dtype=np.int32)
+        self._richnessBonus[
+            py.constants.Constants.RICHNESS_OK
+        ] = py.constants.Constants.RICHNESS_BONUS_OK
+        self._richnessBonus[
+            py.constants.Constants.RICHNESS_LUSH
+        ] = py.constants.Constants.RICHNESS_BONUS_LUSH
+
+        # per cell : tree size (-1 when empty), owner (-1 when empty), dormancy
+        self.size: np.ndarray = np.full((count, cellCount), -1, dtype=np.int8)
+        self.owner: np.ndarray = np.full((count, cellCount), -1, dtype=np.int8)
+        self.dormant: np.ndarray = np.zeros((count, cellCount), dtype=bool)
+        self.richness: np.ndarray = np.tile(
+            np.array([c.getRichness() for c in board.cells], dtype=np.int8),
+            (count, 1),
+        )
+
+        # per player
+        self.sun: np.ndarray = np.zeros((count, 2), dtype=np.int32)
+        self.score: np.ndarray = np.zeros((count, 2), dtype=np.int32)
+        self.waiting: np.ndarray = np.zeros((count, 2), dtype=bool)
+
+        self.nutrients: np.ndarray = np.zeros(count, dtype=np.int32)
+        self.day: np.ndarray = np.zeros(count, dtype=np.int32)
+        self.orientation: np.ndarray = np.zeros(count, dtype=np.int32)
+
+    @staticmethod
+    def fromBitboards(bitboards: List[py.bitboard.Bitboard]) -> "BatchGame":
+        batch: BatchGame = BatchGame(bitboards[0].board, len(bitboards))
+        for row, bitboard in enumerate(bitboards):
+            batch.setGame(row, bitboard)
+        return batch
+
+    def setGame(self, row: int, bitboard: py.bitboard.Bitboard):
+        for index, cell in enumerate(bitboard.board.cells):
+            self.richness[row, index] = cell.getRichness()
+            self.size[row, index] = bitboard.getSize(index)
+            self.owner[row, index] = bitboard.getOwner(index)
+            self.dormant[row, index] = bool(bitboard.dormant >> index & 1)
+        self.sun[row] = bitboard.sun
+        self.score[row] = bitboard.score
+        self.waiting[row] = bitboard.waiting
+        self.nutrients[row] = bitboard.nutrients
+        self.day[row] = bitboard.round
+        self.orientation[row] = bitboard.orientation
+
+    def encode(self, moveType: int, sourceId: int = 0, targetId: int = 0) -> int:
+        """
+        WAIT is encoded as 0. Ids outside of the board give a code that is
+        always rejected, like a CellNotFoundException would.
+        """
+        if moveType == MoveType.WAIT:
+            return 0
+        if moveType != MoveType.SEED:
+            sourceId = 0
+        if not (0 <= sourceId < self.cellCount and 0 <= targetId < self.cellCount):
+            sourceId, targetId = self.cellCount, 0
+        return (sourceId * self.cellCount + targetId) * 4 + int(moveType)
+
+    # -- Shadows and sun ------------------------------------------------------
+
+    def getShadowLevels(self) -> np.ndarray:
+        """Size of the tallest tree shading each cell, (N, cells)."""
+        levels: np.ndarray = np.zeros((self.count, self.cellCount), dtype=np.int8)
+        if not py.game.Game.ENABLE_SHADOW:
+            return levels
+
+        # sentinel column for off-board sources
+        sizes: np.ndarray = np.concatenate(
+            (self.size, np.full((self.count, 1), -1, dtype=np.int8)), axis=1
+        )
+        sources: np.ndarray = self._sources[:, self.orientation, :]  # (cells, N, 3)
+        for distance in range(1, 4):
+            casters: np.ndarray = np.take_along_axis(
+                sizes, sources[:, :, distance - 1].T, axis=1
+            )
+            levels = np.maximum(levels, np.where(casters >= distance, casters, 0))
+        return levels
+
+    def getSunIncome(self) -> np.ndarray:
+        """Sun each player would gather now, (N, 2)."""
+        lit: np.ndarray = np.where(self.size > self.getShadowLevels(), self.size, 0)
+        return np.stack(
+            [(lit * (self.owner == player)).sum(axis=1) for player in range(2)],
+            axis=1,
+        ).astype(np.int32)
+
+    # -- Frames ---------------------------------------------------------------
+
+    def performSunGatheringUpdate(self):
+        self.waiting[:] = False
+        self.dormant[:] = False
+        self.sun += self.getSunIncome()
+
+    def performActionUpdate(self, actions: np.ndarray):
+        rows: np.ndarray = self._rows
+        cellCount: int = self.cellCount
+        richnessNull: int = py.constants.Constants.RICHNESS_NULL
+        actions = np.asarray(actions, dtype=np.int64)
+
+        availableSun: np.ndarray = self.sun.copy()
+        seedTargets: np.ndarray = np.full((self.count, 2), -1, dtype=np.int64)
+        dying: np.ndarray = np.full((self.count, 2), -1, dtype=np.int64)
+
+        for player in range(2):
+            code: np.ndarray = actions[:, player]
+            moveType: np.ndarray = code % 4
+            targetId: np.ndarray = code // 4 % cellCount
+            sourceId: np.ndarray = code // 4 // cellCount
+            decoded: np.ndarray = (sourceId < cellCount) & (
+                (moveType == MoveType.SEED) | (sourceId == 0)
+            )
+            sourceId = np.where(decoded, sourceId, 0)
+
+            active: np.ndarray = ~self.waiting[:, player]
+            valid: np.ndarray = active & decoded
+            sun: np.ndarray = availableSun[:, player]
+
+            targetSize: np.ndarray = self.size[rows, targetId].astype(np.int64)
+            targetOwned: np.ndarray = self.owner[rows, targetId] == player
+            targetDormant: np.ndarray = self.dormant[rows, targetId]
+            sourceSize: np.ndarray = self.size[rows, sourceId].astype(np.int64)
+
+            owned: np.ndarray = self.owner == player
+            counts: np.ndarray = np.stack(
+                [(owned & (self.size == size)).sum(axis=1) for size in range(4)]
+                + [np.zeros(self.count, dtype=np.int64)],
+                axis=1,
+            )
+            nextSize: np.ndarray = np.clip(targetSize + 1, 0, 4)
+            growthCost: np.ndarray = np.where(
+                targetSize >= py.constants.Constants.TREE_TALL,
+                py.constants.Constants.LIFECYCLE_END_COST,
+                self._baseCost[nextSize] + counts[rows, nextSize],
+            )
+            seedCost: np.ndarray = self._baseCost[0] + counts[:, 0]
+
+            tree: np.ndarray = targetOwned & ~targetDormant & (growthCost <= sun)
+            tall: np.ndarray = targetSize == py.constants.Constants.TREE_TALL
+            grow: np.ndarray = valid & (moveType == MoveType.GROW) & tree & ~tall
+            complete: np.ndarray = valid & (moveType == MoveType.COMPLETE) & tree & tall
+            seed: np.ndarray = (
+                valid
+                & (moveType == MoveType.SEED)
+                & (targetSize < 0)
+                & (self.owner[rows, sourceId] == player)
+                & (sourceSize > py.constants.Constants.TREE_SEED)
+                & ~self.dormant[rows, sourceId]
+                & (self._distances[sourceId, targetId] <= sourceSize)
+                & (self.richness[rows, targetId] != richnessNull)
+                & (seedCost <= sun)
+            )
+            if not py.game.Game.isMoveEnabled(MoveType.GROW):
+                grow[:] = False
+            if not py.game.Game.isMoveEnabled(MoveType.SEED):
+                seed[:] = False
+
+            # waiting or invalid action
+            self.waiting[:, player] |= active & ~(grow | complete | seed)
+
+            self.size[grow, targetId[grow]] += 1
+            self.dormant[grow, targetId[grow]] = True
+            self.dormant[complete, targetId[complete]] = True
+            self.dormant[seed, sourceId[seed]] = True
+            availableSun[:, player] -= np.where(grow | complete, growthCost, 0)
+            availableSun[:, player] -= np.where(seed, seedCost, 0)
+            seedTargets[:, player] = np.where(seed, targetId, -1)
+            dying[:, player] = np.where(complete, targetId, -1)
+
+        conflicting: np.ndarray = (seedTargets[:, 0] >= 0) & (
+            seedTargets[:, 0] == seedTargets[:, 1]
+        )
+        for player in range(2):
+            planted: np.ndarray = ~conflicting & (seedTargets[:, player] >= 0)
+            targets: np.ndarray = seedTargets[planted, player]
+            self.size[planted, targets] = py.constants.Constants.TREE_SEED
+            self.owner[planted, targets] = player
+            self.dormant[planted, targets] = True
+        self.sun = np.where(conflicting[:, None], self.sun, availableSun)
+
+        for player in range(2):
+            cut: np.ndarray = dying[:, player] >= 0
+            targets: np.ndarray = dying[cut, player]
+            self.score[cut, player] += (
+                self.nutrients[cut] + self._richnessBonus[self.richness[cut, targets]]
+            )
+            self.size[cut, targets] = -1
+            self.owner[cut, targets] = -1
+            self.dormant[cut, targets] = False
+        self.nutrients = np.maximum(
+            0, self.nutrients - (dying >= 0).sum(axis=1)
+        ).astype(np.int32)
+
+    def performSunMoveUpdate(self):
+        self.day += 1
+        self.orientation = np.where(
+            self.day < py.game.Game.MAX_ROUNDS,
+            (self.orientation + 1) % 6,
+            self.orientation,
+        ).astype(np.int32)
+
+    def isGameOver(self) -> np.ndarray:
+        return self.day >= py.game.Game.MAX_ROUNDS
+
+    def getFinalScores(self) -> np.ndarray:
+        scores: np.ndarray = self.score + self.sun // 3
+        trees: np.ndarray = np.stack(
+            [(self.owner == player).sum(axis=1) for player in range(2)], axis=1
+        )
+        tied: np.ndarray = scores[:, 0] == scores[:, 1]
+        return np.where(tied[:, None], scores + trees, scores)
@@ -0,0 +1,335 @@
+import copy
+from typing import List, Tuple
+
+import py.board
+import py.constants
+import py.game
+from py.event_type import EventType
+from py.move_type import Move, MoveType
+
+
+# (type, player, ...), see EventType
+Event = Tuple[int, ...]
+
+
+def _bits(mask: int):
+    while mask:
+        low: int = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+class Bitboard:
+    """
+    Alternative representation of a py.game.Game state as integer bitmasks
+    over the cell indices of a board : one mask per owner, per tree size and
+    for dormant trees. Shadows, sun income, costs and legal moves are
+    computed with bit operations on the masks precomputed by the board and
+    give the same results as the object-based engine.
+    """
+
+    def __init__(self, board: py.board.Board):
+        self.board: py.board.Board = board
+
+        self.owners: List[int] = [0, 0]
+        self.sizes: List[int] = [0] * (py.constants.Constants.TREE_TALL + 1)
+        self.dormant: int = 0
+        self.fathers: List[int] = [-1] * len(board.cells)
+
+        self.sun: List[int] = [0, 0]
+        self.score: List[int] = [0, 0]
+        self.waiting: List[bool] = [False, False]
+        self.nutrients: int = 0
+        self.round: int = 0
+        self.orientation: int = 0
+
+        # cells a seed can be planted on
+        self.soil: int = sum(
+            1 << cell.getIndex()
+            for cell in board.cells
+            if cell.getRichness() != py.constants.Constants.RICHNESS_NULL
+        )
+
+    @staticmethod
+    def fromGame(game: py.game.Game) -> "Bitboard":
+        bitboard: Bitboard = Bitboard(game.board)
+        for index, size in enumerate(game.treeSizes):
+            if size < 0:
+                continue
+            bitboard.placeTree(game.treeOwners[index], index, size)
+            if game.treeDormant[index]:
+                bitboard.dormant |= 1 << index
+            bitboard.fathers[index] = game.treeFathers[index]
+
+        for player in game._gameManager.getPlayers():
+            bitboard.sun[player.getIndex()] = player.getSun()
+            bitboard.score[player.getIndex()] = player.getScore()
+            bitboard.waiting[player.getIndex()] = player.isWaiting()
+
+        bitboard.nutrients = game.nutrients
+        bitboard.round = game.round
+        bitboard.orientation = game.sun.getOrientation()
+        return bitboard
+
+    def copy(self) -> "Bitboard":
+        bitboard: Bitboard = copy.copy(self)
+        bitboard.owners = list(self.owners)
+        bitboard.sizes = list(self.sizes)
+        bitboard.fathers = list(self.fathers)
+        bitboard.sun = list(self.sun)
+        bitboard.score = list(self.score)
+        bitboard.waiting = list(self.waiting)
+        return bitboard
+
+    def getTrees(self) -> int:
+        return self.owners[0] | self.owners[1]
+
+    def getSize(self, index: int) -> int:
+        bit: int = 1 << index
+        for size, mask in enumerate(self.sizes):
+            if mask & bit:
+                return size
+        return -1
+
+    def getOwner(self, index: int) -> int:
+        bit: int = 1 << index
+        for owner, mask in enumerate(self.owners):
+            if mask & bit:
+                return owner
+        return -1
+
+    def placeTree(self, player: int, index: int, size: int):
+        bit: int = 1 << index
+        self.owners[player] |= bit
+        self.sizes[size] |= bit
+
+    def removeTree(self, index: int):
+        clear: int = ~(1 << index)
+        self.owners = [mask & clear for mask in self.owners]
+        self.sizes = [mask & clear for mask in self.sizes]
+        self.dormant &= clear
+        self.fathers[index] = -1
+
+    # -- Shadows and sun ------------------------------------------------------
+
+    def getShadowMasks(self, orientation: int = None) -> List[int]:
+        """
+        Masks of the cells shadowed at level >= size, for each size 0-3.
+        A tree of size s on cell c is shadowed when bit c of masks[s] is set.
+        """
+        if orientation is None:
+            orientation = self.orientation
+        masks: List[int] = [0, 0, 0, 0]
+        if not py.game.Game.ENABLE_SHADOW:
+            return masks
+
+        shadowMasks: List[int] = self.board.shadowMasks
+        for size in range(1, 4):
+            for index in _bits(self.sizes[size]):
+                masks[size] |= shadowMasks[(index * 6 + orientation) * 4 + size]
+        masks[2] |= masks[3]
+        masks[1] |= masks[2]
+        return masks
+
+    def getShadowLevels(self) -> List[List[int]]:
+        """Shadow levels of every cell for the 6 sun orientations."""
+        return self.board.getShadowLevels(
+            [self.getSize(index) for index in range(len(self.board.cells))]
+        )
+
+    def getSunIncome(self, orientation: int = None) -> List[int]:
+        shadows: List[int] = self.getShadowMasks(orientation)
+        income: List[int] = [0, 0]
+        for player in range(2):
+            for size in range(1, 4):
+                income[player] += size * _popcount(
+                    self.owners[player] & self.sizes[size] & ~shadows[size]
+                )
+        return income
+
+    def giveSun(self, events: List[Event] = None):
+        income: List[int] = self.getSunIncome()
+        for player in range(2):
+            self.sun[player] += income[player]
+            if events is not None and income[player] > 0:
+                events.append((EventType.GATHER, player, income[player]))
+
+    # -- Costs ----------------------------------------------------------------
+
+    def getCostFor(self, size: int, player: int) -> int:
+        return py.constants.Constants.TREE_BASE_COST[size] + _popcount(
+            self.owners[player] & self.sizes[size]
+        )
+
+    def getSeedCost(self, player: int) -> int:
+        return self.getCostFor(py.constants.Constants.TREE_SEED, player)
+
+    def getGrowthCost(self, index: int) -> int:
+        targetSize: int = self.getSize(index) + 1
+        if targetSize > py.constants.Constants.TREE_TALL:
+            return py.constants.Constants.LIFECYCLE_END_COST
+        return self.getCostFor(targetSize, self.getOwner(index))
+
+    # -- Moves ----------------------------------------------------------------
+
+    def getPossibleMoves(self, player: int) -> List[Move]:
+        """
+        Same moves as Game._getPossibleMoves, unshuffled : WAIT, then the
+        COMPLETE, GROW and SEED moves by increasing cell index.
+        """
+        moves: List[Move] = [(MoveType.WAIT, -1, -1)]
+        if self.waiting[player]:
+            return moves
+
+        sun: int = self.sun[player]
+        active: int = self.owners[player] & ~self.dormant
+
+        completes: List[Move] = list()
+        grows: List[Move] = list()
+        seeds: List[Move] = list()
+
+        if py.constants.Constants.LIFECYCLE_END_COST <= sun:
+            tall: int = active & self.sizes[py.constants.Constants.TREE_TALL]
+            for index in _bits(tall):
+                completes.append((MoveType.COMPLETE, -1, index))
+
+        if py.game.Game.ENABLE_GROW:
+            for size in range(py.constants.Constants.TREE_TALL):
+                if self.getCostFor(size + 1, player) <= sun:
+                    for index in _bits(active & self.sizes[size]):
+                        grows.append((MoveType.GROW, -1, index))
+
+        if py.game.Game.ENABLE_SEED and self.getSeedCost(player) <= sun:
+            free: int = self.soil & ~self.getTrees()
+            seedRangeMasks: List[int] = self.board.seedRangeMasks
+            for size in range(1, 4):
+                for index in _bits(active & self.sizes[size]):
+                    for target in _bits(seedRangeMasks[index * 4 + size] & free):
+                        seeds.append((MoveType.SEED, index, target))
+
+        moves.extend(completes)
+        moves.extend(sorted(grows, key=lambda move: move[2]))
+        moves.extend(sorted(seeds, key=lambda move: move[1]))
+        return moves
+
+    def _isValid(self, player: int, move: Move, availableSun: int) -> bool:
+        moveType, sourceId, targetId = move
+        if not py.game.Game.isMoveEnabled(moveType):
+            return False
+        cellCount: int = len(self.board.cells)
+        if not 0 <= targetId < cellCount:
+            return False
+        target: int = 1 << targetId
+
+        if moveType == MoveType.SEED:
+            if not 0 <= sourceId < cellCount:
+                return False
+            source: int = 1 << sourceId
+            return bool(
+                not target & self.getTrees()
+                and source & self.owners[player]
+                and not source & self.sizes[py.constants.Constants.TREE_SEED]
+                and not source & self.dormant
+                and target
+                & self.board.seedRangeMasks[sourceId * 4 + self.getSize(sourceId)]
+                and target & self.soil
+                and self.getSeedCost(player) <= availableSun
+            )
+
+        tall: bool = bool(target & self.sizes[py.constants.Constants.TREE_TALL])
+        return bool(
+            target & self.owners[player]
+            and not target & self.dormant
+            and tall == (moveType == MoveType.COMPLETE)
+            and self.getGrowthCost(targetId) <= availableSun
+        )
+
+    # -- Frames ---------------------------------------------------------------
+
+    def performSunGatheringUpdate(self, events: List[Event] = None):
+        self.waiting = [False, False]
+        self.dormant = 0
+        self.giveSun(events)
+
+    def performActionUpdate(self, moves: List[Move], events: List[Event] = None):
+        """`events`, when given, receives what happened, see EventType."""
+        if events is None:
+            events = list()
+        availableSun: List[int] = list(self.sun)
+        seeds: List[Move] = list()
+        dying: List[int] = list()
+
+        for player in range(2):
+            if self.waiting[player]:
+                continue
+            move: Move = moves[player]
+            if move[0] == MoveType.WAIT:
+                self.waiting[player] = True
+                events.append((EventType.WAIT, player))
+                continue
+            if not self._isValid(player, move, availableSun[player]):
+                self.waiting[player] = True
+                events.append((EventType.INVALID, player, move))
+                continue
+
+            moveType, sourceId, targetId = move
+            if moveType == MoveType.GROW:
+                availableSun[player] -= self.getGrowthCost(targetId)
+                size: int = self.getSize(targetId)
+                self.sizes[size] &= ~(1 << targetId)
+                self.sizes[size + 1] |= 1 << targetId
+                self.dormant |= 1 << targetId
+                events.append((EventType.GROW, player, targetId))
+            elif moveType == MoveType.COMPLETE:
+                availableSun[player] -= self.getGrowthCost(targetId)
+                dying.append(targetId)
+                self.dormant |= 1 << targetId
+            else:
+                availableSun[player] -= self.getSeedCost(player)
+                self.dormant |= 1 << sourceId
+                seeds.append((player, sourceId, targetId))
+                events.append((EventType.SEED, player, sourceId, targetId))
+
+        if len(set(seed[2] for seed in seeds)) == len(seeds):
+            for player, sourceId, targetId in seeds:
+                self.placeTree(player, targetId, py.constants.Constants.TREE_SEED)
+                self.dormant |= 1 << targetId
+                self.fathers[targetId] = sourceId
+            self.sun = availableSun
+        else:
+            events.append((EventType.SEED_CONFLICT, -1, seeds[0][2]))
+
+        for index in dying:
+            points: int = self.nutrients
+            richness: int = self.board.cells[index].getRichness()
+            if richness == py.constants.Constants.RICHNESS_OK:
+                points += py.constants.Constants.RICHNESS_BONUS_OK
+            elif richness == py.constants.Constants.RICHNESS_LUSH:
+                points += py.constants.Constants.RICHNESS_BONUS_LUSH
+            player: int = self.getOwner(index)
+            self.score[player] += points
+            self.removeTree(index)
+            events.append((EventType.COMPLETE, player, index, points))
+        self.nutrients = max(0, self.nutrients - len(dying))
+
+    def performSunMoveUpdate(self):
+        self.round += 1
+        if self.round < py.game.Game.MAX_ROUNDS:
+            self.orientation = (self.orientation + 1) % 6
+
+    def isGameOver(self) -> bool:
+        return self.round >= py.game.Game.MAX_ROUNDS
+
+    def getFinalScores(self) -> List[int]:
+        scores: List[int] = [
+            self.score[player] + self.sun[player] // 3 for player in range(2)
+        ]
+        if scores[0] == scores[1]:
+            scores = [
+                scores[player] + _popcount(self.owners[player]) for player in range(2)
+            ]
+        return scores
@@ -1,4 +1,5 @@
-from typing import Dict, List
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
 
 from py.java.compat import Random
 
@@ -11,10 +12,21 @@ import py.game
 
 
 class BoardGenerator:
+    """
+    Generated boards are cached, keyed by the generator state and the map
+    config, and games played on the same seed share the same board and its
+    precomputed tables : generated boards are frozen, see Board.freeze.
+    """
 
     board: Dict[py.cube_coord.CubeCoord, py.cell.Cell]
     index: int
 
+    CACHE_SIZE: int = 64
+    # (generator type, generator state, MAP_RING_COUNT, MAX_EMPTY_CELLS,
+    # ENABLE_HOLES) ->
+    # (board, generator state after the generation), least recently used first
+    _cache: "OrderedDict[Tuple, Tuple[py.board.Board, Any]]" = OrderedDict()
+
     @staticmethod
     def generateCell(coord: py.cube_coord.CubeCoord, richness: int):
         cell: py.cell.Cell = py.cell.Cell(BoardGenerator.index)
@@ -23,8 +35,46 @@ class BoardGenerator:
 
         BoardGenerator.index += 1
 
+    @staticmethod
+    def clearCache():
+        BoardGenerator._cache.clear()
+
     @staticmethod
     def generate(random: Random) -> py.board.Board:
+        """
+        Leaves `random` in the state the generation would, whether the board
+        comes from the cache or not.
+        """
+        holes: bool = py.game.Game.ENABLE_HOLES
+        key: Tuple = (
+            # without holes the board does not depend on the generator
+            type(random) if holes else None,
+            random.getState() if holes else None,
+            py.config.Config.MAP_RING_COUNT,
+            py.config.Config.MAX_EMPTY_CELLS,
+            holes,
+        )
+        try:
+            cached: Tuple[py.board.Board, Any] = BoardGenerator._cache.get(key)
+        except TypeError:
+            # unhashable generator state, such as a numpy one
+            return BoardGenerator._generate(random)
+
+        if cached is not None:
+            BoardGenerator._cache.move_to_end(key)
+            board, state = cached
+            if holes:
+                random.setState(state)
+            return board
+
+        board = BoardGenerator._generate(random)
+        BoardGenerator._cache[key] = (board, random.getState())
+        if len(BoardGenerator._cache) > BoardGenerator.CACHE_SIZE:
+            BoardGenerator._cache.popitem(last=False)
+        return board
+
+    @staticmethod
+    def _generate(random: Random) -> py.board.Board:
         BoardGenerator.board = dict()
         BoardGenerator.index = 0
 
@@ -77,4 +127,6 @@ class BoardGenerator:
                     )
                     actualEmptyCells += 1
 
-        return py.board.Board(BoardGenerator.board)
+        board: py.board.Board = py.board.Board(BoardGenerator.board)
+        board.freeze()
+        return board
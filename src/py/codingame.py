@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import abc
 from typing import List, Any, Dict
 from enum import Enum
@@ -230,7 +232,7 @@ class GameManager(abc.ABC): #<Any extends AbstractPlayer>: # abstract public
     def __init__(self):
         #@Inject private
         self.__playerProvider: Provider[Any] = None
-        self.__refereeProvider: Provider<AbstractReferee> = None
+        self.__refereeProvider: Provider[AbstractReferee] = None
         self.__gson: Gson = None
 
         self._players: List[Any] = None
@@ -279,8 +281,8 @@ class GameManager(abc.ABC): #<Any extends AbstractPlayer>: # abstract public
     # @param out
     #            print stream used to issue commands to Game
     #
-    def start(self, is: InputStream, out: PrintStream):
-        self.__s = Scanner(is)
+    def start(self, is_: InputStream, out: PrintStream):
+        self.__s = Scanner(is_)
         try:
             self._out = out
             self.self.__referee = self.__refereeProvider.get()
@@ -773,6 +775,17 @@ class EndScreenModule(Module):
 
 
 class AbstractPlayer(abc.ABC):
+    __slots__ = (
+        "gameManagerProvider",
+        "_index",
+        "_inputs",
+        "_outputs",
+        "_timeout",
+        "_score",
+        "_hasBeenExecuted",
+        "_hasNeverBeenExecuted",
+    )
+
     class TimeoutException(Exception):
         serialVersionUID = 42
 
@@ -780,7 +793,7 @@ class AbstractPlayer(abc.ABC):
 
         # @Inject
         # Provider<GameManager<AbstractPlayer>>
-        self.gameManagerProvider: Provider = Provider(GameManager())
+        self.gameManagerProvider: Provider = None
 
         self._index: int = None
         self._inputs: List[str] = list()
@@ -814,22 +827,22 @@ class AbstractPlayer(abc.ABC):
                 "Sending input data to a player after reading any output is forbidden."
             )
 
-        self.inputs.append(line)
+        self._inputs.append(line)
 
     def execute(self):
         self.gameManagerProvider.get().execute(self)
-        self.hasBeenExecuted = True
-        self.hasNeverBeenExecuted = False
+        self._hasBeenExecuted = True
+        self._hasNeverBeenExecuted = False
 
     def getOutputs(self) -> List[str]:
         self.gameManagerProvider.get().setOuputsRead(True)
         if not self._hasBeenExecuted:
             raise RuntimeError("Can't get outputs without executing it!")
 
-        if self.timeout:
+        if self._timeout:
             raise AbstractPlayer.TimeoutException()
 
-        return self.outputs
+        return self._outputs
 
     @abc.abstractmethod
     def getExpectedOutputLines(self) -> int:
@@ -855,7 +868,7 @@ class AbstractPlayer(abc.ABC):
         self._outputs = outputs
 
     def setTimeout(self, timeout: bool):
-        self.timeout = timeout
+        self._timeout = timeout
 
     def hasTimedOut(self) -> bool:
         return self._timeout
@@ -876,12 +889,14 @@ class AbstractPlayer(abc.ABC):
 
 
 class AbstractMultiplayerPlayer(AbstractPlayer):
+    __slots__ = ("_active",)
+
     def __init__(self):
         super().__init__()
         self._active: bool = True
 
     def getColorToken(self) -> int:
-        return -(self.index + 1)
+        return -(self._index + 1)
 
     def isActive(self) -> bool:
         return self._active
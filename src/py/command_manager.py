@@ -1,12 +1,17 @@
 from typing import List
 import re
 
-from py.action import CompleteAction, GrowAction, SeedAction, WaitAction
+from py.action.Action import Action
+from py.action.CompleteAction import CompleteAction
+from py.action.GrowAction import GrowAction
+from py.action.SeedAction import SeedAction
+from py.action.WaitAction import WaitAction
 
 import py.player
 import py.game
 import py.invalid_input_exception
 import py.game_summary_manager
+from py.move_type import MoveType
 
 from py.java.compat import Singleton
 
@@ -64,7 +69,7 @@ class CommandManager(metaclass=Singleton):
 
             # -- SEED --
             if py.game.Game.ENABLE_SEED:
-                match = CommandManager.PLAYER_SEED_PATTERN.matcher(command)
+                match = CommandManager.PLAYER_SEED_PATTERN.match(command)
                 if match:
                     sourceId: int = int(match.group("sourceId"))
                     targetId: int = int(match.group("targetId"))
@@ -93,6 +98,36 @@ class CommandManager(metaclass=Singleton):
             )
             CommandManager.gameSummaryManager.addPlayerDisqualified(player)
 
+    def setAction(
+        self, player: py.player.Player, action: Action, game: py.game.Game
+    ):
+        """
+        parseCommands for an action given directly : an action the league
+        does not allow deactivates the player as the command would.
+        """
+        if player.isWaiting():
+            return
+
+        if action.isGrow():
+            moveType, command = MoveType.GROW, f"GROW {action.getTargetId()}"
+        elif action.isSeed():
+            moveType, command = (
+                MoveType.SEED,
+                f"SEED {action.getSourceId()} {action.getTargetId()}",
+            )
+        else:
+            moveType, command = MoveType.WAIT, None
+        if not py.game.Game.isMoveEnabled(moveType):
+            e = py.invalid_input_exception.InvalidInputException(
+                py.game.Game.getExpected(), command
+            )
+            self.deactivatePlayer(player, str(e))
+            CommandManager.gameSummaryManager.addPlayerBadCommand(player, e)
+            CommandManager.gameSummaryManager.addPlayerDisqualified(player)
+            return
+
+        player.setAction(action)
+
     def deactivatePlayer(self, player: py.player.Player, message: str):
         player.deactivate(self._escapeHTMLEntities(message))
         player.setScore(-1)
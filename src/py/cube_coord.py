@@ -1,4 +1,16 @@
+from typing import Dict, Tuple
+
+
 class CubeCoord:
+    """
+    Immutable and interned : there is a single instance per (x, y, z), so
+    the coordinates of a board are shared, neighbor() does not allocate once
+    a coordinate exists, and equality is mostly an identity check.
+    """
+
+    __slots__ = ("x", "y", "z", "_hash")
+
+    _interned: Dict[Tuple[int, int, int], "CubeCoord"] = dict()
 
     directions = (
         (1, -1, 0),
@@ -9,10 +21,28 @@ class CubeCoord:
         (0, -1, +1),
     )
 
-    def __init__(self, x: int, y: int, z: int):
-        self.x = x
-        self.y = y
-        self.z = z
+    def __new__(cls, x: int, y: int, z: int) -> "CubeCoord":
+        coord: CubeCoord = CubeCoord._interned.get((x, y, z))
+        if coord is None:
+            coord = super().__new__(cls)
+            object.__setattr__(coord, "x", x)
+            object.__setattr__(coord, "y", y)
+            object.__setattr__(coord, "z", z)
+            object.__setattr__(coord, "_hash", coord.hashCode())
+            CubeCoord._interned[(x, y, z)] = coord
+        return coord
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError("CubeCoord is immutable")
+
+    def __reduce__(self):
+        return (CubeCoord, (self.x, self.y, self.z))
+
+    def __copy__(self) -> "CubeCoord":
+        return self
+
+    def __deepcopy__(self, memo) -> "CubeCoord":
+        return self
 
     def getX(self) -> int:
         return self.x
@@ -32,12 +62,18 @@ class CubeCoord:
         return result
 
     def equals(self, obj) -> bool:
-        if self == obj:
+        if self is obj:
             return True
         if not isinstance(obj, CubeCoord):
             return False
         return (self.x == obj.x) and (self.y == obj.y) and (self.z == obj.z)
 
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, obj) -> bool:
+        return self.equals(obj)
+
     def neighbor(self, orientation: int, distance: int = 1) -> "CubeCoord":
         nx: int = self.x + CubeCoord.directions[orientation][0] * distance
         ny: int = self.y + CubeCoord.directions[orientation][1] * distance
@@ -0,0 +1,11 @@
+from enum import IntEnum
+
+
+class EventType(IntEnum):
+    GATHER = 1  # (GATHER, player, sun)
+    WAIT = 2  # (WAIT, player)
+    INVALID = 3  # (INVALID, player, move)
+    GROW = 4  # (GROW, player, cell)
+    SEED = 5  # (SEED, player, sourceCell, targetCell)
+    SEED_CONFLICT = 6  # (SEED_CONFLICT, -1, targetCell)
+    COMPLETE = 7  # (COMPLETE, player, cell, points)
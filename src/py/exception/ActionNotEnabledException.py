@@ -0,0 +1,6 @@
+from .GameException import GameException
+
+
+class ActionNotEnabledException(GameException):
+    def __init__(self, action: str):
+        super().__init__(f"{action} is not available in this league")
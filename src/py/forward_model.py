@@ -0,0 +1,43 @@
+from typing import List, Tuple
+
+from py.bitboard import Bitboard, Event, Move
+
+
+class ForwardModel:
+    """
+    Side-effect free rules : a state is a Bitboard taken at an action frame,
+    and step() returns the state reached after both players act, without
+    game managers, summaries or tooltips.
+    """
+
+    @staticmethod
+    def step(
+        state: Bitboard, actions: Tuple[Move, Move]
+    ) -> Tuple[Bitboard, List[Event]]:
+        """
+        Applies one action frame. When both players are then waiting, the sun
+        moves and, unless the game is over, the next gathering frame is
+        played, so the returned state is at the next action frame again.
+        """
+        nextState: Bitboard = state.copy()
+        events: List[Event] = list()
+
+        nextState.performActionUpdate(actions, events)
+        if all(nextState.waiting):
+            nextState.performSunMoveUpdate()
+            if not nextState.isGameOver():
+                nextState.performSunGatheringUpdate(events)
+
+        return nextState, events
+
+    @staticmethod
+    def getLegalActions(state: Bitboard, player: int) -> List[Move]:
+        return state.getPossibleMoves(player)
+
+    @staticmethod
+    def isTerminal(state: Bitboard) -> bool:
+        return state.isGameOver()
+
+    @staticmethod
+    def getScores(state: Bitboard) -> List[int]:
+        return state.getFinalScores()
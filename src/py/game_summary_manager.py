@@ -23,6 +23,12 @@ class GameSummaryManager(metaclass=Singleton):
     def clear(self):
         self._lines.clear()
 
+    def getLineCount(self) -> int:
+        return len(self._lines)
+
+    def truncate(self, lineCount: int):
+        del self._lines[lineCount:]
+
     def _add(self, message: str):
         self._lines.append(message)
 
@@ -0,0 +1,184 @@
+from typing import Any, Callable, List, Union
+
+from py.action.Action import Action
+from py.action.CompleteAction import CompleteAction
+from py.action.GrowAction import GrowAction
+from py.action.SeedAction import SeedAction
+from py.action.WaitAction import WaitAction
+
+from py.codingame import AbstractPlayer
+from py.java.compat import Provider, Random
+
+import py.bitboard
+import py.command_manager
+import py.frame_type
+import py.game
+import py.game_summary_manager
+import py.player
+from py.move_type import MoveType
+
+
+# bot called with the input lines of its turn, returns its output line
+LinesBot = Callable[[List[str]], str]
+# bot called with the current state and its player index, returns a move
+StateBot = Callable[
+    [py.bitboard.Bitboard, int], Union[str, py.bitboard.Move, Action]
+]
+
+
+class HeadlessGameManager:
+    """
+    Stands in for MultiplayerGameManager when a match is played in-process :
+    keeps the players and the end of game, and drops the view data, tooltips
+    and game summaries the protocol would send.
+    """
+
+    def __init__(self, players: List[py.player.Player], leagueLevel: int, seed: int):
+        self._players: List[py.player.Player] = players
+        self._leagueLevel: int = leagueLevel
+        self._seed: int = seed
+        self._gameEnd: bool = False
+        self._maxTurns: int = 200
+
+    def getLeagueLevel(self) -> int:
+        return self._leagueLevel
+
+    def getSeed(self) -> int:
+        return self._seed
+
+    def getPlayerCount(self) -> int:
+        return len(self._players)
+
+    def getPlayers(self) -> List[py.player.Player]:
+        return self._players
+
+    def getActivePlayers(self) -> List[py.player.Player]:
+        return [p for p in self._players if p.isActive()]
+
+    def getPlayer(self, i: int) -> py.player.Player:
+        return self._players[i]
+
+    def endGame(self):
+        self._gameEnd = True
+
+    def isGameEnd(self) -> bool:
+        return self._gameEnd
+
+    def setMaxTurns(self, maxTurns: int):
+        self._maxTurns = maxTurns
+
+    def getMaxTurns(self) -> int:
+        return self._maxTurns
+
+    def setFrameDuration(self, frameDuration: int):
+        pass
+
+    def addTooltip(self, *args: Any):
+        pass
+
+    def addToGameSummary(self, summary: str):
+        pass
+
+
+class HeadlessRunner:
+    """
+    Plays matches without the stdin/stdout protocol : the game is driven
+    directly, as Referee.gameTurn does, and each bot is a python callable
+    called once per turn. With `structured` the bots receive a Bitboard of the
+    current state instead of the input lines. `randomFactory` is given to
+    Game.init, see there.
+    """
+
+    def __init__(
+        self,
+        leagueLevel: int = 3,
+        structured: bool = False,
+        randomFactory: Callable[[int], Random] = Random,
+    ):
+        self.leagueLevel: int = leagueLevel
+        self.structured: bool = structured
+        self.randomFactory: Callable[[int], Random] = randomFactory
+        self._commandManager: py.command_manager.CommandManager = (
+            py.command_manager.CommandManager()
+        )
+
+    def play(self, bots: List[Union[LinesBot, StateBot]], seed: int) -> List[int]:
+        players: List[py.player.Player] = list()
+        for i in range(len(bots)):
+            player: py.player.Player = py.player.Player()
+            player.setIndex(i)
+            player.setScore(0)
+            players.append(player)
+        gameManager: HeadlessGameManager = HeadlessGameManager(
+            players, self.leagueLevel, seed
+        )
+        for player in players:
+            player.gameManagerProvider = Provider(gameManager)
+
+        game: py.game.Game = py.game.Game()
+        game._gameManager = gameManager
+        game._gameSummaryManager = py.game_summary_manager.GameSummaryManager()
+        game._gameSummaryManager.clear()
+        game.init(seed, self.randomFactory)
+        # invalid actions are only reported through the protocol
+        game.raiseActionErrors = False
+
+        # the global info is sent before the first turn
+        pending: List[List[str]] = [game.getGlobalInfoFor(p) for p in players]
+
+        while not gameManager.isGameEnd():
+            game.resetGameTurnData()
+
+            if game.getCurrentFrameType() == py.frame_type.FrameType.ACTIONS:
+                for player in gameManager.getActivePlayers():
+                    if not player.isWaiting():
+                        bot = bots[player.getIndex()]
+                        try:
+                            if self.structured:
+                                output = bot(
+                                    py.bitboard.Bitboard.fromGame(game),
+                                    player.getIndex(),
+                                )
+                            else:
+                                lines: List[str] = game.getCurrentFrameInfoFor(player)
+                                output = bot(pending[player.getIndex()] + lines)
+                                pending[player.getIndex()] = list()
+                        except AbstractPlayer.TimeoutException:
+                            self._commandManager.deactivatePlayer(player, "Timeout!")
+                            continue
+                        except Exception as e:
+                            self._commandManager.deactivatePlayer(player, str(e))
+                            continue
+                        self._setAction(player, output, game)
+
+            game.performGameUpdate()
+
+        game.onEnd()
+        return [player.getScore() for player in players]
+
+    def _setAction(
+        self,
+        player: py.player.Player,
+        output: Union[str, py.bitboard.Move, Action],
+        game: py.game.Game,
+    ):
+        # actions the league disallows are refused as their commands would be
+        if isinstance(output, Action):
+            self._commandManager.setAction(player, output, game)
+        elif isinstance(output, tuple):
+            self._commandManager.setAction(
+                player, HeadlessRunner.toAction(output), game
+            )
+        else:
+            self._commandManager.parseCommands(player, [output], game)
+
+    @staticmethod
+    def toAction(move: py.bitboard.Move) -> Action:
+        moveType, sourceId, targetId = move
+        if moveType == MoveType.SEED:
+            return SeedAction(sourceId, targetId)
+        if moveType == MoveType.GROW:
+            return GrowAction(targetId)
+        if moveType == MoveType.COMPLETE:
+            return CompleteAction(targetId)
+        return WaitAction()
@@ -1,5 +1,6 @@
+import abc
 import time
-from typing import List, Any
+from typing import List, Any, Sequence
 
 
 class Provider:
@@ -10,7 +11,7 @@ class Provider:
         return self.provided
 
 
-class Singleton(type):
+class Singleton(abc.ABCMeta):
     _instances = {}
 
     def __call__(cls, *args, **kwargs):
@@ -19,10 +20,19 @@ class Singleton(type):
         return cls._instances[cls]
 
 
+_MULTIPLIER = 0x5DEECE66D
+_ADDEND = 0xB
+_MASK = (1 << 48) - 1
+_INT_LIMIT = 1 << 31
+
+
 class Random:
     """
     Java SE 6 random number generator
     Java's RNG is based on a classic Knuth-style linear congruential formula
+
+    nextInts and shuffle draw a whole batch in one loop, with the same
+    stream as repeated nextInt calls.
     """
 
     def __init__(self, seed=None):
@@ -32,6 +42,13 @@ class Random:
     def setSeed(self, seed):
         self._seed = seed
 
+    def getState(self):
+        """Opaque state for setState, the generators of the engine share it."""
+        return self._seed
+
+    def setState(self, state):
+        self._seed = state
+
     @property
     def seed(self):
         return self._seed
@@ -48,7 +65,7 @@ class Random:
         or 1.
         """
         bits = max(1, min(32, bits))  # clip to 1 - 32
-        self._seed = (self._seed * 0x5DEECE66D + 0xB) & ((1 << 48) - 1)
+        self._seed = (self._seed * _MULTIPLIER + _ADDEND) & _MASK
         retval = self._seed >> (48 - bits)
         # Python and Java don't really agree on how ints work. This converts
         # the unsigned generated int into a signed int if necessary.
@@ -75,14 +92,56 @@ class Random:
 
         bits = self.next(31)
         val = bits % n
-        while (bits - val + n - 1) < 0:
+        # Java rejects the draw when bits - val + (n - 1) overflows an int
+        while (bits - val + n - 1) >= _INT_LIMIT:
             bits = self.next(31)
             val = bits % n
 
         return val
 
+    def nextInts(self, bounds: Sequence[int]) -> List[int]:
+        """Same as [nextInt(n) for n in bounds], in a single loop."""
+        seed = self._seed
+        values = list()
+        for n in bounds:
+            if n <= 0:
+                self._seed = seed
+                raise ValueError("Argument must be positive!")
+            seed = (seed * _MULTIPLIER + _ADDEND) & _MASK
+            bits = seed >> 17
+            if not (n & (n - 1)):  # power of two?
+                values.append((n * bits) >> 31)
+                continue
+            val = bits % n
+            while (bits - val + n - 1) >= _INT_LIMIT:
+                seed = (seed * _MULTIPLIER + _ADDEND) & _MASK
+                bits = seed >> 17
+                val = bits % n
+            values.append(val)
+        self._seed = seed
+        return values
+
+    def shuffle(self, lst: List[Any]):
+        """In-place Collections.shuffle(lst, this), in a single loop."""
+        seed = self._seed
+        for i in range(len(lst), 1, -1):
+            seed = (seed * _MULTIPLIER + _ADDEND) & _MASK
+            bits = seed >> 17
+            if not (i & (i - 1)):  # power of two?
+                j = (i * bits) >> 31
+            else:
+                j = bits % i
+                while (bits - j + i - 1) >= _INT_LIMIT:
+                    seed = (seed * _MULTIPLIER + _ADDEND) & _MASK
+                    bits = seed >> 17
+                    j = bits % i
+            lst[i - 1], lst[j] = lst[j], lst[i - 1]
+        self._seed = seed
+
     def nextLong(self):
-        raise NotImplementedError
+        """Return a random signed 64-bit integer, as Java's nextLong()."""
+        value = (self.next(32) << 32) + self.next(32)
+        return (value + (1 << 63)) % (1 << 64) - (1 << 63)
 
     def nextBoolean(self):
         raise NotImplementedError
@@ -126,10 +185,9 @@ class Collections:
 
     @staticmethod
     def shuffle(lst: List[Any], rnd: Random):
-        size: int = len(lst)
-        for i in range(size, 1, -1):
-            j: int = rnd.nextInt(i)
-            lst[i - 1], lst[j] = lst[j], lst[i - 1]  # swap(arr, i-1, j);
+        # for i in range(size, 1, -1):
+        #     j = rnd.nextInt(i); swap(arr, i-1, j);
+        rnd.shuffle(lst)
 
 
 class JsonObject:
@@ -0,0 +1,13 @@
+from enum import IntEnum
+from typing import Tuple
+
+
+class MoveType(IntEnum):
+    WAIT = 0
+    SEED = 1
+    GROW = 2
+    COMPLETE = 3
+
+
+# (type, sourceId, targetId), ids not used by the move type are -1
+Move = Tuple[MoveType, int, int]
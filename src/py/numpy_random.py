@@ -0,0 +1,45 @@
+from typing import Any, List, Sequence
+
+import numpy as np
+
+
+class NumpyRandom:
+    """
+    A numpy Generator behind the methods of py.java.compat.Random the engine
+    uses, for Game.init(seed, NumpyRandom) when the games do not have to
+    match the Java referee. Draws are vectorized and spawn() gives
+    statistically independent streams, e.g. one per game of a batch.
+    getState and setState carry the bit generator state, a dict.
+    """
+
+    def __init__(self, seed: Any = None):
+        """`seed` is anything np.random.default_rng accepts."""
+        self.generator: np.random.Generator = np.random.default_rng(seed)
+
+    @staticmethod
+    def spawn(seed: int, count: int) -> List["NumpyRandom"]:
+        return [
+            NumpyRandom(child)
+            for child in np.random.SeedSequence(seed).spawn(count)
+        ]
+
+    def nextInt(self, n: int = None) -> int:
+        if n is None:
+            return int(self.generator.integers(-(1 << 31), 1 << 31))
+        if n <= 0:
+            raise ValueError("Argument must be positive!")
+        return int(self.generator.integers(n))
+
+    def nextInts(self, bounds: Sequence[int]) -> List[int]:
+        if len(bounds) == 0:
+            return list()
+        return self.generator.integers(0, np.asarray(bounds)).tolist()
+
+    def shuffle(self, lst: List[Any]):
+        self.generator.shuffle(lst)
+
+    def getState(self) -> dict:
+        return self.generator.bit_generator.state
+
+    def setState(self, state: dict):
+        self.generator.bit_generator.state = state
@@ -0,0 +1,85 @@
+from typing import List, Dict, Tuple
+
+import py.board
+
+
+class ShadowMap:
+    """
+    Shadows cast by the trees on the board, kept for all 6 sun orientations.
+    Every cell counts the trees of each size shading it, so placing, growing
+    or removing a tree only updates the rays of that tree, and moving the sun
+    is a lookup into another orientation.
+    """
+
+    def __init__(self, board: py.board.Board):
+        self._rays: List[int] = board.rays
+        self._cellCount: int = len(board.coords)
+
+        # _casters[orientation][cell * 4 + size] : trees of that size shading the cell
+        self._casters: List[List[int]] = None
+        # _levels[orientation][cell] : size of the tallest tree shading the cell
+        self._levels: List[List[int]] = None
+
+        self.clear()
+
+    def clear(self):
+        self._casters = [[0] * (self._cellCount * 4) for _ in range(6)]
+        self._levels = [[0] * self._cellCount for _ in range(6)]
+
+    def snapshot(self) -> Tuple:
+        return (
+            tuple(tuple(casters) for casters in self._casters),
+            tuple(tuple(levels) for levels in self._levels),
+        )
+
+    def restore(self, snapshot: Tuple):
+        self._casters = [list(casters) for casters in snapshot[0]]
+        self._levels = [list(levels) for levels in snapshot[1]]
+
+    def addTree(self, index: int, size: int):
+        for orientation in range(6):
+            casters: List[int] = self._casters[orientation]
+            levels: List[int] = self._levels[orientation]
+            ray: int = (index * 6 + orientation) * 3
+            for key in self._rays[ray : ray + size]:
+                if key < 0:
+                    break
+                casters[key * 4 + size] += 1
+                if levels[key] < size:
+                    levels[key] = size
+
+    def removeTree(self, index: int, size: int):
+        for orientation in range(6):
+            casters: List[int] = self._casters[orientation]
+            levels: List[int] = self._levels[orientation]
+            ray: int = (index * 6 + orientation) * 3
+            for key in self._rays[ray : ray + size]:
+                if key < 0:
+                    break
+                casters[key * 4 + size] -= 1
+                if levels[key] == size and casters[key * 4 + size] == 0:
+                    level: int = size - 1
+                    while level > 0 and casters[key * 4 + level] == 0:
+                        level -= 1
+                    levels[key] = level
+
+    def growTree(self, index: int, size: int):
+        """`size` is the size of the tree before it grew."""
+        self.removeTree(index, size)
+        self.addTree(index, size + 1)
+
+    def getShadow(self, index: int, orientation: int) -> int:
+        return self._levels[orientation][index]
+
+    def getLevels(self, orientation: int) -> List[int]:
+        return self._levels[orientation]
+
+    def getAllLevels(self) -> List[List[int]]:
+        return self._levels
+
+    def asDict(self, orientation: int) -> Dict[int, int]:
+        return {
+            index: level
+            for (index, level) in enumerate(self._levels[orientation])
+            if level > 0
+        }
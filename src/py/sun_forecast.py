@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from typing import List, Sequence, Tuple
+
+import py.board
+import py.game
+
+
+class SunForecast:
+    """
+    Sun income of each player for the coming sun moves, assuming the trees
+    stay as they are. The income of a tree configuration is computed once
+    for the 6 sun orientations from the board shadow tables, and kept in a
+    least recently used cache keyed by the configuration.
+    """
+
+    def __init__(
+        self, board: py.board.Board, capacity: int = 1 << 12, shadows: bool = True
+    ):
+        self.board: py.board.Board = board
+        self.capacity: int = capacity
+        self.shadows: bool = shadows
+        # configuration key -> incomes[orientation][player]
+        self._cache: "OrderedDict[bytes, List[List[int]]]" = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def getIncomes(
+        self, sizes: Sequence[int], owners: Sequence[int]
+    ) -> List[List[int]]:
+        """Income of each player for every sun orientation, incomes[o][player]."""
+        key: bytes = bytes(size + 1 for size in sizes) + bytes(
+            owner + 1 for owner in owners
+        )
+        incomes: List[List[int]] = self._cache.get(key)
+        if incomes is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return incomes
+
+        self.misses += 1
+        cellCount: int = len(self.board.cells)
+        levels: List[List[int]] = (
+            self.board.getShadowLevels(sizes)
+            if self.shadows
+            else [[0] * cellCount] * 6
+        )
+        incomes = [
+            py.game.Game.getSunIncome(sizes, owners, levels[orientation])
+            for orientation in range(6)
+        ]
+
+        self._cache[key] = incomes
+        if len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+        return incomes
+
+    def forecast(
+        self,
+        sizes: Sequence[int],
+        owners: Sequence[int],
+        orientation: int,
+        moves: int = 6,
+    ) -> Tuple[List[int], ...]:
+        """
+        Income of each player for the sun orientations orientation,
+        orientation + 1, ... of the next `moves` sun moves, one list per
+        player.
+        """
+        incomes: List[List[int]] = self.getIncomes(sizes, owners)
+        return tuple(
+            [incomes[(orientation + move) % 6][player] for move in range(moves)]
+            for player in range(2)
+        )
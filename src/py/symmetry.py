@@ -0,0 +1,144 @@
+from typing import List, Sequence, Tuple
+
+import py.bitboard
+import py.board
+
+
+# (rotation in steps of 60 degrees, reflected), identity first
+SYMMETRIES: Tuple[Tuple[int, bool], ...] = tuple(
+    (rotation, reflected) for reflected in (False, True) for rotation in range(6)
+)
+
+
+def _transform(
+    x: int, y: int, z: int, rotation: int, reflected: bool
+) -> Tuple[int, int, int]:
+    if reflected:
+        # mirror along direction 0 / 1 : directions o and 1 - o are swapped
+        y, z = z, y
+    for _ in range(rotation):
+        # direction o becomes direction o + 1
+        x, y, z = -y, -z, -x
+    return x, y, z
+
+
+class Symmetry:
+    """
+    Rotations and reflections of the hexagonal board, as cell permutation
+    tables, to key states by a canonical representative : symmetric states
+    get the same key.
+
+    A rotation also turns the sun, so the rotated state plays exactly like
+    the original. A reflection reverses the direction the sun moves in, so it
+    only keeps the shadows of the current round : reflections are for caches
+    of static evaluations and are not used unless asked for.
+    """
+
+    def __init__(self, board: py.board.Board, reflections: bool = False):
+        self.board: py.board.Board = board
+        cellCount: int = len(board.cells)
+        indexes = {
+            (coord.getX(), coord.getY(), coord.getZ()): index
+            for index, coord in enumerate(board.coords)
+        }
+
+        # permutations[s][cell] : cell the symmetry s moves the cell to, -1
+        # when it leaves the board; inverses[s][cell] : cell moved to the cell
+        self.permutations: List[Tuple[int, ...]] = list()
+        self.inverses: List[Tuple[int, ...]] = list()
+        # orientations[s][orientation] : sun orientation after the symmetry s
+        self.orientations: List[Tuple[int, ...]] = list()
+        for rotation, reflected in SYMMETRIES:
+            permutation: List[int] = [
+                indexes.get(
+                    _transform(
+                        coord.getX(), coord.getY(), coord.getZ(), rotation, reflected
+                    ),
+                    -1,
+                )
+                for coord in board.coords
+            ]
+            inverse: List[int] = [-1] * cellCount
+            for index, target in enumerate(permutation):
+                if target >= 0:
+                    inverse[target] = index
+            self.permutations.append(tuple(permutation))
+            self.inverses.append(tuple(inverse))
+            self.orientations.append(
+                tuple(
+                    ((1 - o if reflected else o) + rotation) % 6 for o in range(6)
+                )
+            )
+
+        # symmetries in use, the ones keeping every cell on the board
+        self.symmetries: List[int] = [
+            s
+            for s, (rotation, reflected) in enumerate(SYMMETRIES)
+            if (reflections or not reflected) and -1 not in self.permutations[s]
+        ]
+
+        # the board layout is the first part of the keys : only the
+        # symmetries giving the smallest layout can give the smallest key
+        self._layouts: List[bytes] = [
+            bytes(board.cells[source].getRichness() for source in self.inverses[s])
+            if s in self.symmetries
+            else b""
+            for s in range(len(SYMMETRIES))
+        ]
+        layout: bytes = min(self._layouts[s] for s in self.symmetries)
+        self.candidates: List[int] = [
+            s for s in self.symmetries if self._layouts[s] == layout
+        ]
+        self.layout: bytes = layout
+
+    @staticmethod
+    def getCellCodes(
+        sizes: Sequence[int], owners: Sequence[int], dormant: Sequence[bool]
+    ) -> List[int]:
+        """One small int per cell : 0 when empty, else size, owner, dormancy."""
+        return [
+            0 if size < 0 else 1 + size + 4 * owner + 8 * bool(dormant[index])
+            for index, (size, owner) in enumerate(zip(sizes, owners))
+        ]
+
+    def getCanonicalKey(
+        self, codes: Sequence[int], orientation: int
+    ) -> Tuple[bytes, int]:
+        """
+        Smallest key of the symmetric states, and the symmetry giving it :
+        a cell c of the state is the cell permutations[symmetry][c] of the
+        canonical state. The key includes the board layout.
+        """
+        best: bytes = None
+        bestSymmetry: int = 0
+        for s in self.candidates:
+            inverse: Tuple[int, ...] = self.inverses[s]
+            key: bytes = bytes((self.orientations[s][orientation],)) + bytes(
+                codes[source] for source in inverse
+            )
+            if best is None or key < best:
+                best, bestSymmetry = key, s
+        return self.layout + best, bestSymmetry
+
+    def getGameKey(self, game) -> Tuple[bytes, int]:
+        return self.getCanonicalKey(
+            Symmetry.getCellCodes(game.treeSizes, game.treeOwners, game.treeDormant),
+            game.sun.getOrientation(),
+        )
+
+    def getBitboardKey(self, bitboard: py.bitboard.Bitboard) -> Tuple[bytes, int]:
+        cellCount: int = len(self.board.cells)
+        return self.getCanonicalKey(
+            Symmetry.getCellCodes(
+                [bitboard.getSize(index) for index in range(cellCount)],
+                [bitboard.getOwner(index) for index in range(cellCount)],
+                [bitboard.dormant >> index & 1 for index in range(cellCount)],
+            ),
+            bitboard.orientation,
+        )
+
+    def mapCell(self, symmetry: int, index: int) -> int:
+        return self.permutations[symmetry][index]
+
+    def unmapCell(self, symmetry: int, index: int) -> int:
+        return self.inverses[symmetry][index]
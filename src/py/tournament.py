@@ -0,0 +1,239 @@
+import argparse
+import itertools
+import os
+import queue
+import subprocess
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Union
+
+from py.codingame import AbstractPlayer
+from py.java.compat import Random
+
+import py.headless_runner
+
+
+CONFIG_DIR: str = os.path.join(os.path.dirname(__file__), "..", "..", "config")
+
+# a bot is either the path of a CodinGame-style script or a picklable factory
+# returning a fresh LinesBot for each game
+BotSpec = Union[str, Callable[[], py.headless_runner.LinesBot]]
+
+
+class ScriptBot:
+    """
+    Bot running a script that reads its input on stdin and prints its
+    command, like the config/Boss*.py bots, in a child process. An answer
+    later than the referee turn limits, in seconds, is a timeout.
+    """
+
+    def __init__(
+        self, path: str, firstTurnMaxTime: float = 1.0, turnMaxTime: float = 0.1
+    ):
+        self.path: str = path
+        self.firstTurnMaxTime: float = firstTurnMaxTime
+        self.turnMaxTime: float = turnMaxTime
+        self._process: subprocess.Popen = None
+        # lines printed by the script, None once it exited
+        self._outputs: "queue.Queue[str]" = None
+
+    def _start(self):
+        self._process = subprocess.Popen(
+            [sys.executable, "-u", self.path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        self._outputs = queue.Queue()
+        threading.Thread(
+            target=ScriptBot._read,
+            args=(self._process.stdout, self._outputs),
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def _read(stdout, outputs: "queue.Queue[str]"):
+        with stdout:
+            for line in stdout:
+                outputs.put(line)
+        outputs.put(None)
+
+    def __call__(self, lines: List[str]) -> str:
+        maxTime: float = self.turnMaxTime
+        if self._process is None:
+            self._start()
+            maxTime = self.firstTurnMaxTime
+        self._process.stdin.write("\n".join(lines) + "\n")
+        self._process.stdin.flush()
+        try:
+            output: str = self._outputs.get(timeout=maxTime)
+        except queue.Empty:
+            raise AbstractPlayer.TimeoutException()
+        if output is None:
+            raise RuntimeError(f"{self.path} exited")
+        return output.strip()
+
+    def close(self):
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process.stdin.close()
+            self._process = None
+
+
+class GameResult:
+    def __init__(self, seed: int, names: Tuple[str, str], scores: List[int]):
+        self.seed: int = seed
+        self.names: Tuple[str, str] = names  # player 0, player 1
+        self.scores: List[int] = scores
+
+    def getWinner(self) -> str:
+        if self.scores[0] == self.scores[1]:
+            return None
+        return self.names[0] if self.scores[0] > self.scores[1] else self.names[1]
+
+    def __str__(self):
+        return (
+            f"seed {self.seed}: {self.names[0]} {self.scores[0]}"
+            f" - {self.scores[1]} {self.names[1]}"
+        )
+
+
+def _makeBot(
+    spec: BotSpec, firstTurnMaxTime: float, turnMaxTime: float
+) -> py.headless_runner.LinesBot:
+    if isinstance(spec, str):
+        return ScriptBot(spec, firstTurnMaxTime, turnMaxTime)
+    return spec()
+
+
+def _playGame(
+    names: Tuple[str, str],
+    specs: Tuple[BotSpec, BotSpec],
+    seed: int,
+    leagueLevel: int,
+    randomFactory: Callable[[int], Random],
+    firstTurnMaxTime: float,
+    turnMaxTime: float,
+) -> GameResult:
+    bots: List[py.headless_runner.LinesBot] = [
+        _makeBot(spec, firstTurnMaxTime, turnMaxTime) for spec in specs
+    ]
+    try:
+        scores: List[int] = py.headless_runner.HeadlessRunner(
+            leagueLevel, randomFactory=randomFactory
+        ).play(bots, seed)
+    finally:
+        for bot in bots:
+            if isinstance(bot, ScriptBot):
+                bot.close()
+    return GameResult(seed, names, scores)
+
+
+class Tournament:
+    """
+    Plays every pairing of the bots on every seed, once per side, across a
+    pool of worker processes, and yields the results as games finish.
+    `randomFactory` must be picklable, see Game.init. The turn time limits,
+    in seconds, apply to the script bots.
+    """
+
+    def __init__(
+        self,
+        bots: Dict[str, BotSpec],
+        seeds: Iterable[int],
+        leagueLevel: int = 3,
+        workers: int = None,
+        randomFactory: Callable[[int], Random] = Random,
+        firstTurnMaxTime: float = 1.0,
+        turnMaxTime: float = 0.1,
+    ):
+        self.bots: Dict[str, BotSpec] = bots
+        self.seeds: List[int] = list(seeds)
+        self.leagueLevel: int = leagueLevel
+        self.workers: int = workers
+        self.randomFactory: Callable[[int], Random] = randomFactory
+        self.firstTurnMaxTime: float = firstTurnMaxTime
+        self.turnMaxTime: float = turnMaxTime
+
+    @staticmethod
+    def getBosses() -> Dict[str, str]:
+        return {
+            f"Boss{level}": os.path.abspath(os.path.join(CONFIG_DIR, f"Boss{level}.py"))
+            for level in range(3)
+        }
+
+    def getGames(self) -> List[Tuple[str, str, int]]:
+        games: List[Tuple[str, str, int]] = list()
+        for first, second in itertools.combinations(self.bots, 2):
+            for seed in self.seeds:
+                games.append((first, second, seed))
+                games.append((second, first, seed))
+        return games
+
+    def run(self) -> Iterator[GameResult]:
+        pool: ProcessPoolExecutor = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            futures = [
+                pool.submit(
+                    _playGame,
+                    (first, second),
+                    (self.bots[first], self.bots[second]),
+                    seed,
+                    self.leagueLevel,
+                    self.randomFactory,
+                    self.firstTurnMaxTime,
+                    self.turnMaxTime,
+                )
+                for (first, second, seed) in self.getGames()
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # the games not started yet are dropped when the caller stops early
+            pool.shutdown(cancel_futures=True)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Spring Challenge 2021 tournament")
+    parser.add_argument("bots", nargs="*", help="bot scripts, the bosses if none")
+    parser.add_argument("--seeds", type=int, default=10, help="number of seeds")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--league", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--first-turn-time", type=float, default=1.0, help="seconds, first turn"
+    )
+    parser.add_argument(
+        "--turn-time", type=float, default=0.1, help="seconds, later turns"
+    )
+    args = parser.parse_args(argv)
+
+    bots: Dict[str, BotSpec] = (
+        {os.path.basename(path): os.path.abspath(path) for path in args.bots}
+        if args.bots
+        else Tournament.getBosses()
+    )
+    tournament: Tournament = Tournament(
+        bots,
+        range(args.first_seed, args.first_seed + args.seeds),
+        args.league,
+        args.workers,
+        firstTurnMaxTime=args.first_turn_time,
+        turnMaxTime=args.turn_time,
+    )
+
+    wins: Dict[str, int] = {name: 0 for name in bots}
+    for result in tournament.run():
+        print(result, flush=True)
+        winner: str = result.getWinner()
+        if winner is not None:
+            wins[winner] += 1
+
+    for name, count in sorted(wins.items(), key=lambda item: -item[1]):
+        print(f"{name}: {count} wins")
+
+
+if __name__ == "__main__":
+    main()
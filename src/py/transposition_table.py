@@ -0,0 +1,56 @@
+from typing import Any, List, Tuple
+
+
+class TranspositionTable:
+    """
+    Fixed size table of search results keyed by a 64-bit state hash. Each
+    hash has a single slot. An entry is always updated by a result for the
+    same hash, and replaced by a result for another hash that was searched
+    at least as deep, or by any result once it is from an older search
+    (see newSearch).
+    """
+
+    def __init__(self, capacity: int = 1 << 16):
+        self.capacity: int = capacity
+        self._hashes: List[int] = [None] * capacity
+        self._depths: List[int] = [0] * capacity
+        self._values: List[Any] = [None] * capacity
+        self._generations: List[int] = [0] * capacity
+        self._generation: int = 0
+
+    def clear(self):
+        self._hashes = [None] * self.capacity
+        self._depths = [0] * self.capacity
+        self._values = [None] * self.capacity
+        self._generations = [0] * self.capacity
+        self._generation = 0
+
+    def newSearch(self):
+        self._generation += 1
+
+    def get(self, hash: int) -> Tuple[int, Any]:
+        """The (depth, value) stored for the hash, or None."""
+        slot: int = hash % self.capacity
+        if self._hashes[slot] != hash:
+            return None
+        self._generations[slot] = self._generation
+        return self._depths[slot], self._values[slot]
+
+    def put(self, hash: int, depth: int, value: Any) -> bool:
+        """Returns whether the result was stored."""
+        slot: int = hash % self.capacity
+        if (
+            self._hashes[slot] is not None
+            and self._hashes[slot] != hash
+            and self._generations[slot] == self._generation
+            and self._depths[slot] > depth
+        ):
+            return False
+        self._hashes[slot] = hash
+        self._depths[slot] = depth
+        self._values[slot] = value
+        self._generations[slot] = self._generation
+        return True
+
+    def __len__(self) -> int:
+        return sum(1 for h in self._hashes if h is not None)
@@ -0,0 +1,55 @@
+from typing import List
+
+from py.java.compat import Random
+
+import py.board
+
+
+MASK_64: int = (1 << 64) - 1
+
+
+class Zobrist:
+    """
+    64-bit Zobrist keys of a board. The trees are hashed incrementally : the
+    key of a tree depends on its cell, owner, size and dormancy, and the
+    trees hash is the xor of the keys of all the trees. The other features
+    (sun orientation, round, nutrients and per-player sun, score and waiting
+    flag) are few, so they are mixed in by getHash() when asked.
+    """
+
+    def __init__(self, board: "py.board.Board", seed: int = 0x5EED):
+        random: Random = Random(seed)
+        # _treeKeys[((cell * 2 + owner) * 4 + size) * 2 + dormant]
+        self._treeKeys: List[int] = [
+            random.nextLong() & MASK_64 for _ in range(len(board.cells) * 16)
+        ]
+        self._salt: int = random.nextLong() & MASK_64
+
+    def getTreeKey(self, index: int, owner: int, size: int, dormant: bool) -> int:
+        return self._treeKeys[((index * 2 + owner) * 4 + size) * 2 + bool(dormant)]
+
+    def _mix(self, feature: int, value: int) -> int:
+        # splitmix64 finalizer, the scalar features take any value
+        x: int = (self._salt + (feature << 32) + value) & MASK_64
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK_64
+        return x ^ (x >> 31)
+
+    def getHash(
+        self,
+        treesHash: int,
+        orientation: int,
+        round: int,
+        nutrients: int,
+        players: List[List[int]],
+    ) -> int:
+        """`players` holds the sun, score and waiting flag of each player."""
+        h: int = treesHash
+        h ^= self._mix(0, orientation)
+        h ^= self._mix(1, round)
+        h ^= self._mix(2, nutrients)
+        for player, (sun, score, waiting) in enumerate(players):
+            h ^= self._mix(3 + player * 3, sun)
+            h ^= self._mix(4 + player * 3, score)
+            h ^= self._mix(5 + player * 3, int(waiting))
+        return h
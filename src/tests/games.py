@@ -0,0 +1,37 @@
+from typing import List
+
+from py.java.compat import Provider
+
+import py.frame_type
+import py.game
+import py.game_summary_manager
+import py.headless_runner
+import py.player
+
+
+def newGame(seed: int, leagueLevel: int = 3) -> py.game.Game:
+    """Initialised game with two players, played by hand through the frames."""
+    players: List[py.player.Player] = list()
+    for i in range(2):
+        player: py.player.Player = py.player.Player()
+        player.setIndex(i)
+        player.setScore(0)
+        players.append(player)
+    gameManager = py.headless_runner.HeadlessGameManager(players, leagueLevel, seed)
+    for player in players:
+        player.gameManagerProvider = Provider(gameManager)
+    game: py.game.Game = py.game.Game()
+    game._gameManager = gameManager
+    game._gameSummaryManager = py.game_summary_manager.GameSummaryManager()
+    game._gameSummaryManager.clear()
+    game.init(seed)
+    game.raiseActionErrors = False
+    return game
+
+
+def toActionFrame(game: py.game.Game):
+    """Plays the frames up to the next action frame, ready for actions."""
+    game.resetGameTurnData()
+    while game.getCurrentFrameType() != py.frame_type.FrameType.ACTIONS:
+        game.performGameUpdate()
+        game.resetGameTurnData()
@@ -0,0 +1,44 @@
+import copy
+import pickle
+import unittest
+
+from py.action.Action import Action
+from py.action.CompleteAction import CompleteAction
+from py.action.GrowAction import GrowAction
+from py.action.SeedAction import SeedAction
+from py.action.WaitAction import WaitAction
+
+import py.player
+
+
+class ActionTest(unittest.TestCase):
+    ACTIONS = (
+        SeedAction(3, 4),
+        GrowAction(5),
+        CompleteAction(6),
+        WaitAction(),
+        Action.NO_ACTION,
+    )
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            SeedAction(3, 4).targetId = 5
+
+    def test_copy_and_pickle(self):
+        for action in ActionTest.ACTIONS:
+            for other in (
+                copy.copy(action),
+                copy.deepcopy(action),
+                pickle.loads(pickle.dumps(action)),
+            ):
+                self.assertEqual(other, action)
+                self.assertIs(type(other), type(action))
+
+    def test_deepcopy_player(self):
+        player: py.player.Player = py.player.Player()
+        player.setAction(SeedAction(1, 2))
+        self.assertEqual(copy.deepcopy(player).getAction(), SeedAction(1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
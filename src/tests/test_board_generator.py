@@ -0,0 +1,66 @@
+import copy
+import pickle
+import unittest
+
+from py.java.compat import Random
+
+import py.board
+import py.board_generator
+import py.config
+import py.game
+
+from games import newGame
+
+
+class IntStateRandom(Random):
+    """Another generator whose state is an int, like the Java one."""
+
+
+class BoardGeneratorTest(unittest.TestCase):
+    def setUp(self):
+        newGame(0)  # league settings
+        py.board_generator.BoardGenerator.clearCache()
+
+    def test_cache(self):
+        fresh: Random = Random(7)
+        board: py.board.Board = py.board_generator.BoardGenerator._generate(fresh)
+        first, second = Random(7), Random(7)
+        cached: py.board.Board = py.board_generator.BoardGenerator.generate(first)
+        self.assertIs(py.board_generator.BoardGenerator.generate(second), cached)
+        self.assertEqual(first.getState(), fresh.getState())
+        self.assertEqual(second.getState(), fresh.getState())
+        self.assertEqual(
+            [cell.getRichness() for cell in cached.cells],
+            [cell.getRichness() for cell in board.cells],
+        )
+
+    def test_generator_type(self):
+        board: py.board.Board = py.board_generator.BoardGenerator.generate(Random(7))
+        self.assertIsNot(
+            py.board_generator.BoardGenerator.generate(IntStateRandom(7)), board
+        )
+
+    def test_frozen(self):
+        board: py.board.Board = py.board_generator.BoardGenerator.generate(Random(7))
+        with self.assertRaises(AttributeError):
+            board.cells[0].setRichness(0)
+        with self.assertRaises(TypeError):
+            board.map[board.coords[0]] = board.cells[1]
+        with self.assertRaises(TypeError):
+            board.rays[0] = 1
+        with self.assertRaises(AttributeError):
+            board.cells = list()
+
+    def test_copy_and_pickle(self):
+        board: py.board.Board = py.board_generator.BoardGenerator.generate(Random(7))
+        for other in (copy.deepcopy(board), pickle.loads(pickle.dumps(board))):
+            self.assertEqual(other.rays, board.rays)
+            self.assertEqual(other.distances, board.distances)
+            self.assertEqual(
+                [cell.getRichness() for cell in other.cells],
+                [cell.getRichness() for cell in board.cells],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+import random
+import unittest
+from typing import List, Tuple
+
+import py.action_error
+import py.bitboard
+import py.frame_type
+import py.game
+import py.headless_runner
+import py.sun_forecast
+from py.move_type import Move, MoveType
+
+from games import newGame
+
+try:
+    import numpy as np
+
+    import py.batch_game
+except ImportError:  # numpy is optional
+    np = None
+
+
+def randomMove(bot: random.Random, moves: List[Move]) -> Move:
+    """A legal move, or often an arbitrary one, possibly invalid or disabled."""
+    r: float = bot.random()
+    if r < 0.2:
+        return (MoveType.GROW, -1, bot.randrange(37))
+    if r < 0.4:
+        return (MoveType.SEED, bot.randrange(37), bot.randrange(37))
+    if r < 0.45:
+        return (MoveType.COMPLETE, -1, bot.randrange(37))
+    return bot.choice(moves)
+
+
+def state(bitboard: py.bitboard.Bitboard) -> Tuple:
+    return (
+        [bitboard.getSize(index) for index in range(37)],
+        [bitboard.getOwner(index) for index in range(37)],
+        [bool(bitboard.dormant >> index & 1) for index in range(37)],
+        list(bitboard.sun),
+        list(bitboard.score),
+        list(bitboard.waiting),
+    )
+
+
+def batchState(batch, row: int) -> Tuple:
+    return (
+        batch.size[row].tolist(),
+        batch.owner[row].tolist(),
+        batch.dormant[row].tolist(),
+        batch.sun[row].tolist(),
+        batch.score[row].tolist(),
+        batch.waiting[row].tolist(),
+    )
+
+
+class EnginesTest(unittest.TestCase):
+    def check(self, seed: int, leagueLevel: int):
+        """Game, Bitboard and BatchGame play the same moves to the same states."""
+        game: py.game.Game = newGame(seed, leagueLevel)
+        bot: random.Random = random.Random(seed)
+        gameManager = game._gameManager
+        mirror: py.bitboard.Bitboard = py.bitboard.Bitboard.fromGame(game)
+        batch = None
+        if np is not None:
+            batch = py.batch_game.BatchGame(mirror.board, 1)
+            batch.setGame(0, mirror)
+
+        while not gameManager.isGameEnd():
+            game.resetGameTurnData()
+            frame: py.frame_type.FrameType = game.getCurrentFrameType()
+            if frame == py.frame_type.FrameType.GATHERING:
+                mirror.performSunGatheringUpdate()
+                if batch is not None:
+                    batch.performSunGatheringUpdate()
+            elif frame == py.frame_type.FrameType.ACTIONS:
+                moves: List[Move] = [(MoveType.WAIT, -1, -1)] * 2
+                for player in gameManager.getPlayers():
+                    if not player.isWaiting():
+                        moves[player.getIndex()] = randomMove(
+                            bot, list(game.generateMoves(player))
+                        )
+                        player.setAction(
+                            py.headless_runner.HeadlessRunner.toAction(
+                                moves[player.getIndex()]
+                            )
+                        )
+                mirror.performActionUpdate(moves)
+                if batch is not None:
+                    batch.performActionUpdate(
+                        np.array([[batch.encode(*move) for move in moves]])
+                    )
+            elif frame == py.frame_type.FrameType.SUN_MOVE:
+                mirror.performSunMoveUpdate()
+                if batch is not None:
+                    batch.performSunMoveUpdate()
+            game.performGameUpdate()
+
+            self.assertEqual(state(py.bitboard.Bitboard.fromGame(game)), state(mirror))
+            if batch is not None:
+                self.assertEqual(batchState(batch, 0), state(mirror))
+
+    def test_leagues(self):
+        for leagueLevel in (1, 2, 3):
+            for seed in range(4):
+                with self.subTest(leagueLevel=leagueLevel, seed=seed):
+                    self.check(seed, leagueLevel)
+
+    def test_disabled_moves(self):
+        game: py.game.Game = newGame(0, 2)
+        mirror: py.bitboard.Bitboard = py.bitboard.Bitboard.fromGame(game)
+        player = game._gameManager.getPlayer(0)
+        seed = py.headless_runner.HeadlessRunner.toAction((MoveType.SEED, 8, 21))
+        self.assertEqual(
+            game.validateAction(player, seed),
+            py.action_error.ActionError.ACTION_NOT_ENABLED,
+        )
+        self.assertFalse(mirror._isValid(0, (MoveType.SEED, 8, 21), 100))
+
+    def test_sun_forecast(self):
+        for seed in range(5):
+            game: py.game.Game = newGame(seed)
+            gameManager = game._gameManager
+            players = gameManager.getPlayers()
+            bot: random.Random = random.Random(seed)
+            # random moves up to round 5, then everybody waits
+            forecast: Tuple[List[int], ...] = None
+            given: List[List[int]] = [[], []]
+            while not gameManager.isGameEnd():
+                game.resetGameTurnData()
+                frame: py.frame_type.FrameType = game.getCurrentFrameType()
+                if frame == py.frame_type.FrameType.ACTIONS:
+                    if forecast is None and game.round >= 5:
+                        forecast = game.getSunForecast(6)
+                    for player in players:
+                        if not player.isWaiting():
+                            move: Move = (
+                                bot.choice(list(game.generateMoves(player)))
+                                if forecast is None
+                                else (MoveType.WAIT, -1, -1)
+                            )
+                            player.setAction(
+                                py.headless_runner.HeadlessRunner.toAction(move)
+                            )
+                suns: List[int] = [player.getSun() for player in players]
+                game.performGameUpdate()
+                if forecast is not None and frame == py.frame_type.FrameType.GATHERING:
+                    for player in players:
+                        given[player.getIndex()].append(
+                            player.getSun() - suns[player.getIndex()]
+                        )
+            # the first forecast sun move is the round already gathered
+            self.assertGreaterEqual(len(given[0]), 5)
+            self.assertEqual(
+                [sun[:5] for sun in given], [income[1:6] for income in forecast]
+            )
+
+    def test_sun_forecast_cache(self):
+        game: py.game.Game = newGame(1)
+        forecast = py.sun_forecast.SunForecast(game.board, capacity=2)
+        cellCount: int = len(game.board.cells)
+        owners: List[int] = [0, 1] + [-1] * (cellCount - 2)
+        trees: List[List[int]] = [[-1] * cellCount for _ in range(3)]
+        trees[1][0] = 1
+        trees[2][1] = 2
+
+        first = forecast.getIncomes(trees[0], owners)
+        forecast.getIncomes(trees[1], owners)
+        self.assertIs(forecast.getIncomes(trees[0], owners), first)
+        self.assertEqual((forecast.hits, forecast.misses), (1, 2))
+        # trees[1] is the least recently used, evicted by trees[2]
+        forecast.getIncomes(trees[2], owners)
+        self.assertEqual(len(forecast._cache), 2)
+        self.assertIs(forecast.getIncomes(trees[0], owners), first)
+        forecast.getIncomes(trees[1], owners)
+        self.assertEqual((forecast.hits, forecast.misses), (2, 4))
+        self.assertEqual(len(forecast._cache), 2)
+        self.assertEqual(
+            forecast.forecast(trees[2], owners, 5, 3), ([0, 0, 0], [2, 2, 2])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import random
+import unittest
+from typing import Dict, List, Tuple
+
+import py.bitboard
+from py.forward_model import ForwardModel
+from py.move_type import Move
+
+from games import newGame
+
+
+def fullState(bitboard: py.bitboard.Bitboard) -> Dict:
+    return {
+        name: list(value) if isinstance(value, list) else value
+        for name, value in vars(bitboard).items()
+    }
+
+
+class ForwardModelTest(unittest.TestCase):
+    def test_step(self):
+        """step() leaves its state untouched and gives the same result twice."""
+        for seed in range(5):
+            state: py.bitboard.Bitboard = py.bitboard.Bitboard.fromGame(
+                newGame(seed)
+            )
+            state.performSunGatheringUpdate()
+            bot: random.Random = random.Random(seed)
+            steps: int = 0
+            while not ForwardModel.isTerminal(state):
+                actions: Tuple[Move, Move] = tuple(
+                    bot.choice(ForwardModel.getLegalActions(state, player))
+                    for player in range(2)
+                )
+                before: Dict = fullState(state)
+                nextState, events = ForwardModel.step(state, actions)
+                self.assertEqual(fullState(state), before)
+
+                otherState, otherEvents = ForwardModel.step(state, actions)
+                self.assertEqual(fullState(otherState), fullState(nextState))
+                self.assertEqual(otherEvents, events)
+                self.assertEqual(fullState(state), before)
+
+                state = nextState
+                steps += 1
+            self.assertGreater(steps, 24)
+            scores: List[int] = ForwardModel.getScores(state)
+            self.assertEqual(len(scores), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
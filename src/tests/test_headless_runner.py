@@ -0,0 +1,29 @@
+import random
+import unittest
+
+import py.headless_runner
+from py.move_type import MoveType
+
+
+def stateBot(seed: int):
+    bot: random.Random = random.Random(seed)
+    return lambda state, player: bot.choice(state.getPossibleMoves(player))
+
+
+class HeadlessRunnerTest(unittest.TestCase):
+    def test_structured_bots(self):
+        runner = py.headless_runner.HeadlessRunner(structured=True)
+        scores = runner.play([stateBot(1), stateBot(2)], 5)
+        self.assertEqual(scores, runner.play([stateBot(1), stateBot(2)], 5))
+        self.assertTrue(all(score >= 0 for score in scores))
+
+    def test_disabled_moves_deactivate(self):
+        # seeds are not allowed in Wood 1 : the command would be refused
+        runner = py.headless_runner.HeadlessRunner(leagueLevel=2, structured=True)
+        seeder = lambda state, player: (MoveType.SEED, 0, 1)
+        waiter = lambda state, player: (MoveType.WAIT, -1, -1)
+        self.assertEqual(runner.play([seeder, waiter], 5)[0], -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from py.java.compat import Collections, Random
+
+
+def javaRandom(seed: int) -> Random:
+    """Random seeded like `new Random(seed)`, which scrambles the seed."""
+    random: Random = Random()
+    random.seed = seed
+    return random
+
+
+class RandomTest(unittest.TestCase):
+    """Outputs of java.util.Random for the same seeds."""
+
+    def test_next(self):
+        self.assertEqual(javaRandom(42).nextInt(), -1170105035)
+        self.assertEqual(javaRandom(0).nextInt(), -1155484576)
+        self.assertEqual(javaRandom(42).nextLong(), -5025562857975149833)
+
+    def test_nextInt(self):
+        random: Random = javaRandom(42)
+        self.assertEqual(
+            [random.nextInt(10) for _ in range(8)], [0, 3, 8, 4, 0, 5, 5, 8]
+        )
+
+    def test_nextInts(self):
+        self.assertEqual(javaRandom(42).nextInts([10] * 8), [0, 3, 8, 4, 0, 5, 5, 8])
+
+        # powers of two and bounds large enough to reject draws
+        bounds = [10, 16, 37, 3 << 29, 1, 7] * 5
+        batched, single = javaRandom(1337), javaRandom(1337)
+        self.assertEqual(batched.nextInts(bounds), [single.nextInt(n) for n in bounds])
+        self.assertEqual(batched.getState(), single.getState())
+
+    def test_shuffle(self):
+        values = list(range(10))
+        Collections.shuffle(values, javaRandom(1337))
+        self.assertEqual(values, [2, 8, 9, 4, 7, 3, 6, 5, 0, 1])
+
+        values = list(range(10))
+        javaRandom(1337).shuffle(values)
+        self.assertEqual(values, [2, 8, 9, 4, 7, 3, 6, 5, 0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import random
+import unittest
+from typing import List
+
+import py.bitboard
+import py.frame_type
+import py.game
+import py.headless_runner
+from py.symmetry import SYMMETRIES, Symmetry
+
+from games import newGame
+
+
+def moved(symmetry: Symmetry, s: int, codes: List[int]) -> List[int]:
+    """The cell codes of the state moved by the symmetry s."""
+    result: List[int] = [0] * len(codes)
+    for index, code in enumerate(codes):
+        result[symmetry.mapCell(s, index)] = code
+    return result
+
+
+class SymmetryTest(unittest.TestCase):
+    def test_permutations(self):
+        for seed in range(5):
+            board = newGame(seed).board
+            symmetry: Symmetry = Symmetry(board, reflections=True)
+            cellCount: int = len(board.cells)
+            # the full hexagon is kept by all of them, holes included
+            self.assertEqual(symmetry.symmetries, list(range(len(SYMMETRIES))))
+            for s in symmetry.symmetries:
+                permutation = symmetry.permutations[s]
+                self.assertEqual(sorted(permutation), list(range(cellCount)))
+                for index in range(cellCount):
+                    self.assertEqual(symmetry.unmapCell(s, permutation[index]), index)
+                    for orientation in range(6):
+                        neighbour: int = board.getNeighbourIndex(index, orientation)
+                        image: int = board.getNeighbourIndex(
+                            permutation[index], symmetry.orientations[s][orientation]
+                        )
+                        if neighbour < 0:
+                            self.assertLess(image, 0)
+                        else:
+                            self.assertEqual(image, permutation[neighbour])
+
+    def test_canonical_keys(self):
+        for seed in range(5):
+            game: py.game.Game = newGame(seed)
+            board = game.board
+            symmetry: Symmetry = Symmetry(board, reflections=True)
+            # the symmetries keeping the holes where they are
+            kept: List[int] = [
+                s
+                for s in symmetry.symmetries
+                if all(
+                    board.cells[symmetry.mapCell(s, index)].getRichness()
+                    == cell.getRichness()
+                    for index, cell in enumerate(board.cells)
+                )
+            ]
+            # the holes come in opposite pairs : the half turn always keeps them
+            self.assertIn(3, kept)
+
+            bot: random.Random = random.Random(seed)
+            gameManager = game._gameManager
+            while not gameManager.isGameEnd():
+                game.resetGameTurnData()
+                if game.getCurrentFrameType() == py.frame_type.FrameType.ACTIONS:
+                    key, s0 = symmetry.getGameKey(game)
+                    self.assertEqual(
+                        symmetry.getBitboardKey(py.bitboard.Bitboard.fromGame(game)),
+                        (key, s0),
+                    )
+                    codes: List[int] = Symmetry.getCellCodes(
+                        game.treeSizes, game.treeOwners, game.treeDormant
+                    )
+                    orientation: int = game.sun.getOrientation()
+                    for s in kept:
+                        self.assertEqual(
+                            symmetry.getCanonicalKey(
+                                moved(symmetry, s, codes),
+                                symmetry.orientations[s][orientation],
+                            )[0],
+                            key,
+                        )
+                    # the key is the state moved by the symmetry returned
+                    self.assertEqual(
+                        key,
+                        symmetry.layout
+                        + bytes((symmetry.orientations[s0][orientation],))
+                        + bytes(moved(symmetry, s0, codes)),
+                    )
+                    for player in gameManager.getPlayers():
+                        if not player.isWaiting():
+                            player.setAction(
+                                py.headless_runner.HeadlessRunner.toAction(
+                                    bot.choice(list(game.generateMoves(player)))
+                                )
+                            )
+                game.performGameUpdate()
+
+    def test_different_states(self):
+        game: py.game.Game = newGame(0)
+        symmetry: Symmetry = Symmetry(game.board)
+        codes: List[int] = Symmetry.getCellCodes(
+            game.treeSizes, game.treeOwners, game.treeDormant
+        )
+        key, _ = symmetry.getCanonicalKey(codes, 0)
+        # one more tree on the centre, which no symmetry moves
+        codes[0] = 1
+        self.assertNotEqual(symmetry.getCanonicalKey(codes, 0)[0], key)
+        # the same trees under another sun
+        codes[0] = 0
+        self.assertNotEqual(symmetry.getCanonicalKey(codes, 1)[0], key)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import tempfile
+import unittest
+
+from py.codingame import AbstractPlayer
+from py.tournament import ScriptBot, _makeBot
+
+
+class ScriptBotTest(unittest.TestCase):
+    def script(self, source: str) -> str:
+        handle, path = tempfile.mkstemp(suffix=".py")
+        with os.fdopen(handle, "w") as file:
+            file.write(source)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_answer(self):
+        bot = ScriptBot(self.script("while True:\n    input()\n    print('WAIT')\n"))
+        self.addCleanup(bot.close)
+        self.assertEqual(bot(["0"]), "WAIT")
+        self.assertEqual(bot(["1"]), "WAIT")
+
+    def test_timeout(self):
+        bot = ScriptBot(
+            self.script("import time\ninput()\ntime.sleep(10)\n"), firstTurnMaxTime=0.2
+        )
+        self.addCleanup(bot.close)
+        with self.assertRaises(AbstractPlayer.TimeoutException):
+            bot(["0"])
+
+    def test_time_limits(self):
+        bot = _makeBot(self.script("input()\n"), 2.0, 0.5)
+        self.addCleanup(bot.close)
+        self.assertEqual((bot.firstTurnMaxTime, bot.turnMaxTime), (2.0, 0.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import random
+import unittest
+from typing import List, Tuple
+
+from py.action.GrowAction import GrowAction
+from py.action.WaitAction import WaitAction
+
+import py.frame_type
+import py.game
+import py.headless_runner
+import py.player
+
+from games import newGame, toActionFrame
+
+
+def play(seed: int, search: bool) -> List[Tuple]:
+    """
+    Plays random moves, and with `search` makes and unmakes other moves in
+    the middle of every action frame. Returns the state after each frame.
+    """
+    game: py.game.Game = newGame(seed)
+    bot: random.Random = random.Random(seed)
+    players: List[py.player.Player] = game._gameManager.getPlayers()
+    trace: List[Tuple] = list()
+    while not game._gameManager.isGameEnd():
+        game.resetGameTurnData()
+        if game.getCurrentFrameType() == py.frame_type.FrameType.ACTIONS:
+            for player in players:
+                if not player.isWaiting():
+                    player.setAction(
+                        py.headless_runner.HeadlessRunner.toAction(
+                            bot.choice(list(game.generateMoves(player)))
+                        )
+                    )
+            if search:
+                summary: str = game._gameSummaryManager.getSummary()
+                for _ in range(2):
+                    game.make(
+                        [
+                            py.headless_runner.HeadlessRunner.toAction(
+                                bot.choice(list(game.generateMoves(player)))
+                            )
+                            for player in players
+                        ]
+                    )
+                    game.unmake()
+                assert game._gameSummaryManager.getSummary() == summary
+            else:
+                for _ in range(2):
+                    for player in players:
+                        bot.choice(list(game.generateMoves(player)))
+        game.performGameUpdate()
+        trace.append(
+            (game.snapshot(), game._gameSummaryManager.getSummary(), game.getHash())
+        )
+    return trace
+
+
+class UndoTest(unittest.TestCase):
+    def test_make_unmake_keeps_the_current_frame(self):
+        for seed in range(10):
+            self.assertEqual(play(seed, False), play(seed, True), seed)
+
+    def test_make_unmake_keeps_available_sun(self):
+        suns: List[List[int]] = list()
+        for search in (False, True):
+            game: py.game.Game = newGame(7)
+            toActionFrame(game)
+            players: List[py.player.Player] = game._gameManager.getPlayers()
+            players[0].setSun(50)
+            game.availableSun[0] = 50
+            for player in players:
+                player.setAction(WaitAction())
+            if search:
+                game.make([GrowAction(game.treeOwners.index(0)), WaitAction()])
+                game.unmake()
+                self.assertEqual(game.availableSun[0], 50)
+            game.performGameUpdate()
+            suns.append([player.getSun() for player in players])
+        self.assertEqual(suns[0], suns[1])
+
+    def test_snapshot_restore(self):
+        for seed in range(5):
+            game: py.game.Game = newGame(seed)
+            gameManager = game._gameManager
+            players: List[py.player.Player] = gameManager.getPlayers()
+            bot: random.Random = random.Random(seed)
+            while game.round < 8:
+                game.resetGameTurnData()
+                if game.getCurrentFrameType() == py.frame_type.FrameType.ACTIONS:
+                    for player in players:
+                        if not player.isWaiting():
+                            player.setAction(
+                                py.headless_runner.HeadlessRunner.toAction(
+                                    bot.choice(list(game.generateMoves(player)))
+                                )
+                            )
+                game.performGameUpdate()
+            snapshot: Tuple = game.snapshot()
+
+            def playOn() -> List[Tuple]:
+                """Plays to the end, with the shuffled frame inputs in the trace."""
+                bot: random.Random = random.Random(seed + 100)
+                trace: List[Tuple] = list()
+                while not gameManager.isGameEnd():
+                    game.resetGameTurnData()
+                    if game.getCurrentFrameType() == py.frame_type.FrameType.ACTIONS:
+                        for player in players:
+                            if not player.isWaiting():
+                                trace.append(game.getCurrentFrameInfoFor(player))
+                                player.setAction(
+                                    py.headless_runner.HeadlessRunner.toAction(
+                                        bot.choice(list(game.generateMoves(player)))
+                                    )
+                                )
+                    game.performGameUpdate()
+                    trace.append((game.snapshot(), game.getHash()))
+                return trace
+
+            trace: List[Tuple] = playOn()
+            game.restore(snapshot)
+            self.assertEqual(game.snapshot(), snapshot)
+            self.assertEqual(
+                game.shadows.getAllLevels(), game.board.getShadowLevels(game.treeSizes)
+            )
+            gameManager._gameEnd = False
+            self.assertEqual(playOn(), trace)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from typing import List
+
+from py.action.Action import Action
+from py.action.GrowAction import GrowAction
+from py.action.WaitAction import WaitAction
+
+import py.game
+import py.zobrist
+from py.transposition_table import TranspositionTable
+
+from games import newGame, toActionFrame
+
+
+def grow(seed: int, order: List[int]) -> py.game.Game:
+    """Player 0 grows its first trees in the given order, player 1 waits."""
+    game: py.game.Game = newGame(seed)
+    toActionFrame(game)
+    game._gameManager.getPlayer(0).setSun(50)
+    trees: List[int] = [
+        index for index, owner in enumerate(game.treeOwners) if owner == 0
+    ]
+    for rank in order:
+        actions: List[Action] = [GrowAction(trees[rank]), WaitAction()]
+        game.make(actions)
+    return game
+
+
+class ZobristTest(unittest.TestCase):
+    def test_move_orders(self):
+        for seed in range(5):
+            first: py.game.Game = grow(seed, [0, 1])
+            hash: int = first.getHash()
+            snapshot = first.snapshot()
+            second: py.game.Game = grow(seed, [1, 0])
+            self.assertEqual(second.snapshot()[:2], snapshot[:2])
+            self.assertEqual(second.getHash(), hash)
+
+    def test_different_positions(self):
+        for seed in range(5):
+            hashes: List[int] = [
+                grow(seed, order).getHash() for order in ([], [0], [1], [0, 1])
+            ]
+            self.assertEqual(len(set(hashes)), len(hashes))
+
+    def test_unmake(self):
+        game: py.game.Game = grow(0, [])
+        hash: int = game.getHash()
+        game.make([GrowAction(game.treeOwners.index(0)), WaitAction()])
+        self.assertNotEqual(game.getHash(), hash)
+        game.unmake()
+        self.assertEqual(game.getHash(), hash)
+
+    def test_keys_built_once(self):
+        first: py.game.Game = newGame(3)
+        zobrist: py.zobrist.Zobrist = first.zobrist
+        self.assertIs(first.board.zobrist, zobrist)
+        self.assertIs(newGame(3).zobrist, zobrist)
+
+
+class TranspositionTableTest(unittest.TestCase):
+    def test_lookup(self):
+        table: TranspositionTable = TranspositionTable(8)
+        self.assertIsNone(table.get(1))
+        self.assertTrue(table.put(1, 2, "a"))
+        self.assertEqual(table.get(1), (2, "a"))
+        # another hash in the same slot
+        self.assertIsNone(table.get(9))
+        self.assertEqual(len(table), 1)
+
+    def test_replacement(self):
+        table: TranspositionTable = TranspositionTable(8)
+        table.put(1, 3, "a")
+        # same hash : always updated
+        self.assertTrue(table.put(1, 1, "b"))
+        self.assertEqual(table.get(1), (1, "b"))
+        # other hash : only when searched at least as deep
+        table.put(1, 3, "a")
+        self.assertFalse(table.put(9, 2, "c"))
+        self.assertEqual(table.get(1), (3, "a"))
+        self.assertTrue(table.put(9, 3, "c"))
+        self.assertIsNone(table.get(1))
+        self.assertEqual(table.get(9), (3, "c"))
+
+    def test_ageing(self):
+        table: TranspositionTable = TranspositionTable(8)
+        table.put(1, 5, "a")
+        table.newSearch()
+        # an entry of an older search is replaced by any result
+        self.assertTrue(table.put(9, 0, "b"))
+        self.assertEqual(table.get(9), (0, "b"))
+        # unless it was used by the current search
+        table.put(2, 5, "c")
+        table.newSearch()
+        table.get(2)
+        self.assertFalse(table.put(10, 0, "d"))
+        table.clear()
+        self.assertEqual(len(table), 0)
+        self.assertIsNone(table.get(2))
+
+
+if __name__ == "__main__":
+    unittest.main()